@@ -380,12 +380,21 @@ class BaseAction(ABC):
     def reset_settings_to_defaults(self):
         """
         Reset all settings for this action to their default values.
+        
+        All defaults are written through one QSettings object, so they are
+        synced to storage once instead of once per setting.
         """
-        schema = self.get_settings_schema()
-        for setting_name, setting_def in schema.items():
-            default_value = setting_def.get('default')
-            if default_value is not None:
-                self.set_setting(setting_name, default_value)
+        from qgis.PyQt.QtCore import QSettings
+        settings = QSettings()
+        settings.beginGroup(f"RightClickUtilities/{self.action_id}")
+        try:
+            schema = self.get_settings_schema()
+            for setting_name, setting_def in schema.items():
+                default_value = setting_def.get('default')
+                if default_value is not None:
+                    settings.setValue(setting_name, default_value)
+        finally:
+            settings.endGroup()
     
     def get_all_settings(self):
         """
@@ -5,12 +5,19 @@ This module provides dynamic context menu generation based on detected features
 and their types, supporting multiple overlapping features and context-aware actions.
 """
 
+from collections import namedtuple
+import logging
 from qgis.PyQt.QtWidgets import QMenu, QAction
 from qgis.core import QgsFeature, QgsVectorLayer
 from typing import List, Dict, Optional
 from .feature_detector import DetectedFeature
 from .actions.base_action import BaseAction
 
+log = logging.getLogger(__name__)
+
+# Data of a menu QAction built here: the action to execute and its click context
+_MenuEntry = namedtuple('_MenuEntry', 'action context')
+
 
 class ContextMenuBuilder:
     """
@@ -43,19 +50,22 @@ class ContextMenuBuilder:
         click_type = context.get('click_type', 'canvas')
         detected_features = context.get('detected_features', [])
         
-        print(f"Building context menu for click_type: {click_type}, features: {len(detected_features)}")
+        log.debug("Building context menu for click_type: %s, features: %d", click_type, len(detected_features))
+        
+        # One slot dispatches every action of the menu and its submenus
+        menu.triggered.connect(self._on_menu_triggered)
         
         if not detected_features:
             # No features detected - show canvas actions
-            print("No features detected, showing canvas actions")
+            log.debug("No features detected, showing canvas actions")
             return self._add_canvas_actions(menu, context)
         elif len(detected_features) == 1:
             # Single feature detected - show actions directly in main menu
-            print(f"Single feature detected: {detected_features[0].geometry_type}")
+            log.debug("Single feature detected: %s", detected_features[0].geometry_type)
             return self._add_single_feature_direct_actions(menu, detected_features[0], context)
         else:
             # Multiple features detected - show hierarchical menu with feature selection
-            print(f"Multiple features detected: {len(detected_features)}")
+            log.debug("Multiple features detected: %d", len(detected_features))
             return self._add_multi_feature_hierarchical_menu(menu, detected_features, context)
     
     def _add_canvas_actions(self, menu: QMenu, context: dict) -> bool:
@@ -72,14 +82,10 @@ class ContextMenuBuilder:
         # Get canvas-specific actions
         canvas_actions = self._get_actions_for_scope_and_type('universal', 'canvas')
         
-        print(f"Canvas actions available: {len(canvas_actions)}")
+        log.debug("Canvas actions available: %d", len(canvas_actions))
         
         # Add canvas actions
-        for action in canvas_actions:
-            action_item = menu.addAction(action.name)
-            action_item.triggered.connect(
-                lambda checked, action_obj=action: action_obj.execute(context)
-            )
+        self._add_actions(menu, canvas_actions, context)
         
         # Add separator before universal actions
         menu.addSeparator()
@@ -87,7 +93,7 @@ class ContextMenuBuilder:
         # Add universal actions at the bottom
         self._add_universal_actions(menu, context)
         
-        print(f"Added {len(canvas_actions) + 1} canvas actions to menu")
+        log.debug("Added %d canvas actions to menu", len(canvas_actions) + 1)
         return True
     
     def _add_single_feature_direct_actions(self, menu: QMenu, feature: DetectedFeature, context: dict) -> bool:
@@ -106,49 +112,30 @@ class ContextMenuBuilder:
         
         # Create a specific context for this feature that contains only this feature
         # This ensures actions work on the specific selected feature, not the first detected one
-        specific_context = context.copy()
-        specific_context['feature'] = feature.feature
-        specific_context['layer'] = feature.layer
-        specific_context['detected_features'] = [feature]  # Only this specific feature
+        specific_context = self._get_feature_context(context, feature)
         
         # Add feature-specific actions directly to main menu
         feature_actions = self._get_actions_for_scope_and_type('feature', geometry_type)
-        for action in feature_actions:
-            action_item = menu.addAction(action.name)
-            action_item.triggered.connect(
-                lambda checked, action_obj=action: action_obj.execute(specific_context)
-            )
+        self._add_actions(menu, feature_actions, specific_context)
         
         # Add layer-specific actions
         layer_actions = self._get_actions_for_scope_and_type('layer', geometry_type)
         if layer_actions:
             menu.addSeparator()
-            for action in layer_actions:
-                action_item = menu.addAction(action.name)
-                action_item.triggered.connect(
-                    lambda checked, action_obj=action: action_obj.execute(specific_context)
-                )
+            self._add_actions(menu, layer_actions, specific_context)
         
         # Add universal actions at the bottom
         universal_actions = self._get_actions_for_scope_and_type('universal', geometry_type)
         if universal_actions:
             menu.addSeparator()
-            for action in universal_actions:
-                action_item = menu.addAction(action.name)
-                action_item.triggered.connect(
-                    lambda checked, action_obj=action: action_obj.execute(specific_context)
-                )
+            self._add_actions(menu, universal_actions, specific_context)
         
         # Also add general universal actions (not filtered by geometry type)
         general_universal_actions = self._get_general_universal_actions()
         if general_universal_actions:
             if not universal_actions:  # Only add separator if we didn't already add one
                 menu.addSeparator()
-            for action in general_universal_actions:
-                action_item = menu.addAction(action.name)
-                action_item.triggered.connect(
-                    lambda checked, action_obj=action: action_obj.execute(specific_context)
-                )
+            self._add_actions(menu, general_universal_actions, specific_context)
         
         return True
     
@@ -173,21 +160,13 @@ class ContextMenuBuilder:
         
         # Add feature-specific actions
         feature_actions = self._get_actions_for_scope_and_type('feature', geometry_type)
-        for action in feature_actions:
-            action_item = feature_menu.addAction(action.name)
-            action_item.triggered.connect(
-                lambda checked, action_obj=action: action_obj.execute(context)
-            )
+        self._add_actions(feature_menu, feature_actions, context)
         
         # Add layer-specific actions
         layer_actions = self._get_actions_for_scope_and_type('layer', geometry_type)
         if layer_actions:
             feature_menu.addSeparator()
-            for action in layer_actions:
-                action_item = feature_menu.addAction(action.name)
-                action_item.triggered.connect(
-                    lambda checked, action_obj=action: action_obj.execute(context)
-                )
+            self._add_actions(feature_menu, layer_actions, context)
         
         
         return True
@@ -250,28 +229,17 @@ class ContextMenuBuilder:
         
         # Create a specific context for this feature that contains only this feature
         # This ensures actions work on the specific selected feature, not the first detected one
-        specific_context = context.copy()
-        specific_context['feature'] = feature.feature
-        specific_context['layer'] = feature.layer
-        specific_context['detected_features'] = [feature]  # Only this specific feature
+        specific_context = self._get_feature_context(context, feature)
         
         # Add feature-specific actions
         feature_actions = self._get_actions_for_scope_and_type('feature', geometry_type)
-        for action in feature_actions:
-            action_item = submenu.addAction(action.name)
-            action_item.triggered.connect(
-                lambda checked, action_obj=action: action_obj.execute(specific_context)
-            )
+        self._add_actions(submenu, feature_actions, specific_context)
         
         # Add layer-specific actions
         layer_actions = self._get_actions_for_scope_and_type('layer', geometry_type)
         if layer_actions:
             submenu.addSeparator()
-            for action in layer_actions:
-                action_item = submenu.addAction(action.name)
-                action_item.triggered.connect(
-                    lambda checked, action_obj=action: action_obj.execute(specific_context)
-                )
+            self._add_actions(submenu, layer_actions, specific_context)
         
     
     
@@ -290,13 +258,70 @@ class ContextMenuBuilder:
         
         if universal_actions:
             # Add universal actions
-            for action in universal_actions:
-                action_item = menu.addAction(action.name)
-                action_item.triggered.connect(
-                    lambda checked, action_obj=action: action_obj.execute(context)
-                )
-    
+            self._add_actions(menu, universal_actions, context)
+
+    def _get_feature_context(self, context: dict, feature: DetectedFeature) -> dict:
+        """
+        Get a click context that targets only the given feature.
+        
+        The click context is reused as-is when it already describes exactly this
+        feature (the usual single-feature click); otherwise a copy is made with
+        the feature, layer and detected feature list replaced.
+        
+        Args:
+            context: Click context
+            feature: Detected feature the actions should work on
+            
+        Returns:
+            Context dictionary for the feature
+        """
+        detected_features = context.get('detected_features', ())
+        if (len(detected_features) == 1 and detected_features[0] is feature and
+                context.get('feature') is feature.feature and
+                context.get('layer') is feature.layer):
+            return context
+        
+        return {
+            **context,
+            'feature': feature.feature,
+            'layer': feature.layer,
+            'detected_features': [feature]  # Only this specific feature
+        }
     
+    def _add_actions(self, menu: QMenu, actions: List[BaseAction], context: dict):
+        """
+        Add a batch of actions to the menu in a single update.
+
+        The QActions are created with the menu as parent and appended with one
+        addActions() call, so the menu layout is invalidated once per batch
+        instead of once per action.
+
+        Args:
+            menu: Menu to add actions to
+            actions: Actions to add, in display order
+            context: Click context passed to each action when triggered
+        """
+        menu_actions = []
+        for action in actions:
+            action_item = QAction(action.name, menu)
+            action_item.setData(_MenuEntry(action, context))
+            menu_actions.append(action_item)
+        menu.addActions(menu_actions)
+
+    def _on_menu_triggered(self, action_item: QAction):
+        """
+        Execute the action behind a triggered menu item.
+
+        QMenu.triggered also fires for the items QGIS added to its context menu;
+        those carry no menu entry and are ignored.
+
+        Args:
+            action_item: Triggered menu item
+        """
+        entry = action_item.data()
+        if isinstance(entry, _MenuEntry):
+            entry.action.execute(entry.context)
+
     def _group_features_by_type(self, features: List[DetectedFeature]) -> Dict[str, List[DetectedFeature]]:
         """
         Group features by their geometry type.
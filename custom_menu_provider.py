@@ -24,7 +24,7 @@ class CustomMenuProvider:
     - Provide clean, focused context menu experience
     """
     
-    def __init__(self, context_menu_builder, iface, canvas):
+    def __init__(self, context_menu_builder, iface, canvas, feature_detector=None):
         """
         Initialize the custom menu provider.
         
@@ -32,12 +32,19 @@ class CustomMenuProvider:
             context_menu_builder: ContextMenuBuilder instance for building plugin menus
             iface: QGIS interface instance
             canvas: QGIS map canvas instance
+            feature_detector: FeatureDetector instance shared across clicks (created if not given)
         """
         self.context_menu_builder = context_menu_builder
         self.iface = iface
         self.canvas = canvas
         self.settings = QSettings()
         
+        # Reuse one detector so its per-layer caches survive between clicks
+        if feature_detector is None:
+            from .feature_detector import FeatureDetector
+            feature_detector = FeatureDetector(self.canvas)
+        self.feature_detector = feature_detector
+        
         # Connect to the context menu signal to intercept and modify it
         self.canvas.contextMenuAboutToShow.connect(self.modify_context_menu)
         
@@ -67,9 +74,7 @@ class CustomMenuProvider:
         # Build the plugin's context menu using the existing system
         try:
             # Get click context using the feature detector
-            from .feature_detector import FeatureDetector
-            feature_detector = FeatureDetector(self.canvas)
-            context = feature_detector.get_click_context(event)
+            context = self.feature_detector.get_click_context(event)
             
             # Add canvas and other context information
             context['canvas'] = self.canvas
@@ -7,22 +7,76 @@ multiple feature types and overlapping features detection.
 
 from qgis.core import (
     QgsVectorLayer, QgsFeatureRequest, QgsRectangle, QgsWkbTypes,
-    QgsGeometry, QgsPointXY, QgsSpatialIndex, QgsProject, QgsCoordinateTransform
+    QgsGeometry, QgsPointXY, QgsSpatialIndex, QgsProject, QgsCoordinateTransform,
+    QgsCoordinateReferenceSystem, QgsVectorLayerFeatureSource, QgsApplication, QgsTask,
+    QgsFeedback
 )
 from qgis.gui import QgsMapMouseEvent
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+import logging
+import math
+import os
+
+try:
+    from qgis.core import QgsSpatialIndexKDBush
+except ImportError:
+    # Added in QGIS 3.6, older versions use the generic spatial index for point layers too
+    QgsSpatialIndexKDBush = None
+
+# QgsTask.Silent (no finished/failed notification) was added after QGIS 3.0
+_TASK_SILENT = getattr(QgsTask, 'Silent', 0)
+
+log = logging.getLogger(__name__)
+
+# Sort priority of detected geometry types, lower first; unknown types get 3
+_TYPE_PRIORITY = {
+    'point': 0, 'multipoint': 0,
+    'line': 1, 'multiline': 1,
+    'polygon': 2, 'multipolygon': 2
+}
 
 
-@dataclass
 class DetectedFeature:
     """
     Represents a detected feature with its metadata.
+    
+    Uses __slots__ rather than a dataclass: a click can produce many of these, and
+    dataclass(slots=True) needs Python 3.10, newer than older QGIS 3 releases ship.
     """
-    feature: 'QgsFeature'
-    layer: QgsVectorLayer
-    geometry_type: str  # 'point', 'multipoint', 'line', 'multiline', 'polygon', 'multipolygon'
-    distance: float  # Distance from click point (for prioritization)
+    __slots__ = ('feature', 'layer', 'geometry_type', 'distance', 'priority')
+    
+    def __init__(self, feature: 'QgsFeature', layer: QgsVectorLayer, geometry_type: str,
+                 distance: float, priority: int = 3):
+        """
+        Initialize the detected feature.
+        
+        Args:
+            feature: The detected feature
+            layer: Layer containing the feature
+            geometry_type: 'point', 'multipoint', 'line', 'multiline', 'polygon' or 'multipolygon'
+            distance: Distance from click point (for prioritization)
+            priority: Geometry type priority: points (0), lines (1), polygons (2), unknown (3)
+        """
+        self.feature = feature
+        self.layer = layer
+        self.geometry_type = geometry_type
+        self.distance = distance
+        self.priority = priority
+    
+    def __repr__(self):
+        return (f"DetectedFeature(feature={self.feature!r}, layer={self.layer!r}, "
+                f"geometry_type={self.geometry_type!r}, distance={self.distance!r}, priority={self.priority!r})")
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.feature, self.layer, self.geometry_type, self.distance, self.priority) ==
+                (other.feature, other.layer, other.geometry_type, other.distance, other.priority))
+    
+    __hash__ = None
 
 
 class FeatureDetector:
@@ -49,6 +103,45 @@ class FeatureDetector:
         self.canvas = canvas
         self.point_search_radius = 10  # pixels - extended search for points and lines
         self.default_tolerance = 15  # pixels - default search tolerance for polygons (increased for better outline detection)
+        self.max_index_candidates = 10000  # more index hits than this means the canvas is zoomed far out
+        self.spatial_index_min_features = 200  # smaller layers are scanned directly (indexes are cached)
+        self.spatial_index_max_extent_ratio = 0.1  # larger searches would return most of the index
+        
+        # Spatial indexes reused across clicks: layer ID -> (feature count at build time, index)
+        self._sindex_cache: Dict[str, Tuple[int, QgsSpatialIndex]] = {}
+        # KD-tree indexes of single-point layers, cached and invalidated the same way
+        self._point_index_cache = {}
+        # Layers whose change signals invalidate the cache: layer ID -> (layer, slot)
+        self._sindex_watched_layers = {}
+        # Spatial indexes being built in the background: layer ID -> (feature source,
+        # task, feedback). Holding the task keeps it alive until the task manager has
+        # run it, so an entry is only dropped once its build has finished.
+        self._sindex_tasks = {}
+        # Layers whose running build is stale (layer changed or detector cleaned up);
+        # its result is discarded when it finishes
+        self._stale_sindex_builds = set()
+        
+        # Coordinate transforms reused across clicks: (source CRS, destination CRS) -> transform
+        self._xform_cache: Dict[Tuple[str, str], QgsCoordinateTransform] = {}
+        project = QgsProject.instance()
+        project.crsChanged.connect(self._invalidate_transforms)
+        project.transformContextChanged.connect(self._invalidate_transforms)
+        self.canvas.destinationCrsChanged.connect(self._invalidate_transforms)
+        
+        # Visible vector layers reused across clicks, rebuilt after layer tree changes
+        self._visible_layers_cache: Optional[List[QgsVectorLayer]] = None
+        self._layer_tree_root = project.layerTreeRoot()
+        self._layer_tree_root.visibilityChanged.connect(self._invalidate_visible_layers)
+        self._layer_tree_root.addedChildren.connect(self._invalidate_visible_layers)
+        self._layer_tree_root.removedChildren.connect(self._invalidate_visible_layers)
+        project.layersAdded.connect(self._invalidate_visible_layers)
+        project.layersRemoved.connect(self._invalidate_visible_layers)
+        project.cleared.connect(self._invalidate_visible_layers)
+        
+        # Worker threads searching several layers at once. They only read feature
+        # sources and run GEOS predicates; all layer and canvas access stays on the
+        # GUI thread.
+        self._pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2))
         
     def detect_features_at_point(self, event: QgsMapMouseEvent) -> List[DetectedFeature]:
         """
@@ -63,19 +156,43 @@ class FeatureDetector:
         click_pt = event.mapPoint()
         detected_features = []
         
-        print(f"DEBUG: Click point: {click_pt.x()}, {click_pt.y()}")
+        # Click state shared by every layer searched for this click
+        click = {
+            'point': click_pt,
+            'pt_geom': QgsGeometry.fromPointXY(click_pt),
+            'canvas_crs': self.canvas.mapSettings().destinationCrs(),
+            'map_units_per_pixel': self.canvas.mapUnitsPerPixel(),
+            # Layer CRS -> (click point, click point geometry) in that CRS
+            'layer_points': {},
+            # (layer CRS, tolerance) -> (search rectangle, rectangle request) in that CRS
+            'rect_requests': {}
+        }
+        
+        log.debug("Click point: %s, %s", click_pt.x(), click_pt.y())
         
         # Get all visible vector layers
         visible_layers = self._get_visible_vector_layers()
         
-        print(f"DEBUG: Found {len(visible_layers)} visible vector layers")
+        log.debug("Found %d visible vector layers", len(visible_layers))
         
-        for layer in visible_layers:
-            # Detect features in this layer
-            layer_features = self._detect_features_in_layer(layer, click_pt)
-            detected_features.extend(layer_features)
+        if len(visible_layers) < 2:
+            for layer in visible_layers:
+                # Detect features in this layer
+                detected_features.extend(self._detect_features_in_layer(layer, click))
+        else:
+            # Prepare on the GUI thread, then search the layers in parallel. Each
+            # worker reads from its own feature source snapshot of the layer.
+            layer_searches = []
+            for layer in visible_layers:
+                layer_search = self._prepare_layer_search(layer, click, QgsVectorLayerFeatureSource(layer))
+                if layer_search is not None:
+                    layer_searches.append(layer_search)
+            
+            futures = [self._pool.submit(self._search_layer, layer_search) for layer_search in layer_searches]
+            for future in futures:
+                detected_features.extend(future.result())
         
-        print(f"DEBUG: Total detected features: {len(detected_features)}")
+        log.debug("Total detected features: %d", len(detected_features))
         
         # Sort by priority: points first (closest), then lines, then polygons
         return self._sort_features_by_priority(detected_features)
@@ -84,40 +201,80 @@ class FeatureDetector:
         """
         Get all visible vector layers in the project.
         
+        The list is cached until the layer tree or the project layers change.
+        
         Returns:
             List of visible vector layers
         """
+        if self._visible_layers_cache is not None:
+            return self._visible_layers_cache
+        
         visible_layers = []
-        project = QgsProject.instance()
-        layer_tree_root = project.layerTreeRoot()
+        layer_tree_root = QgsProject.instance().layerTreeRoot()
         
-        for layer in project.mapLayers().values():
-            if isinstance(layer, QgsVectorLayer) and layer.isValid():
-                # Check if layer is visible in the layer tree
-                layer_tree_layer = layer_tree_root.findLayer(layer.id())
-                if layer_tree_layer and layer_tree_layer.isVisible():
+        # Walk the layer tree once instead of looking up every project layer in it
+        for layer_tree_layer in layer_tree_root.findLayers():
+            if layer_tree_layer.isVisible():
+                layer = layer_tree_layer.layer()
+                if isinstance(layer, QgsVectorLayer) and layer.isValid():
                     visible_layers.append(layer)
         
+        self._visible_layers_cache = visible_layers
         return visible_layers
     
-    def _detect_features_in_layer(self, layer: QgsVectorLayer, click_pt: QgsPointXY) -> List[DetectedFeature]:
+    def _invalidate_visible_layers(self, *args):
+        """
+        Drop the cached visible layers list after a layer tree or project change.
+        
+        Args:
+            *args: Signal arguments (unused)
+        """
+        self._visible_layers_cache = None
+    
+    def _detect_features_in_layer(self, layer: QgsVectorLayer, click: Dict) -> List[DetectedFeature]:
         """
         Detect features in a specific layer at the click point.
         CRS-agnostic detection that works regardless of layer CRS differences.
         
         Args:
             layer: Vector layer to search in
-            click_pt: Click point coordinates (in canvas CRS)
+            click: Click state from detect_features_at_point
             
         Returns:
             List of detected features in this layer
         """
-        detected_features = []
+        layer_search = self._prepare_layer_search(layer, click, layer)
+        if layer_search is None:
+            return []
+        return self._search_layer(layer_search)
+    
+    def _prepare_layer_search(self, layer: QgsVectorLayer, click: Dict, source) -> Optional[Dict]:
+        """
+        Prepare everything needed to search a layer at the click point.
+        
+        Must run on the GUI thread: it reads layer and canvas state, and builds
+        the cached spatial index if needed.
+        
+        Args:
+            layer: Vector layer to search in
+            click: Click state from detect_features_at_point (click point and
+                canvas CRS, scale and point geometries shared by all layers)
+            source: Feature source to read from (the layer itself, or a
+                QgsVectorLayerFeatureSource when searching from a worker thread)
+            
+        Returns:
+            Dictionary with the layer search parameters (in layer CRS), or None if
+            the click point cannot be transformed to the layer CRS
+        """
+        click_pt = click['point']
+        canvas_crs = click['canvas_crs']
+        map_units_per_pixel = click['map_units_per_pixel']
         geometry_type = layer.geometryType()
+        layer_crs = layer.crs()
         
-        # Debug: Print layer information
-        print(f"DEBUG: Checking layer '{layer.name()}' - Geometry type: {geometry_type}")
-        print(f"DEBUG: Layer CRS: {layer.crs().authid()}, Canvas CRS: {self.canvas.mapSettings().destinationCrs().authid()}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Checking layer '%s' - Geometry type: %s", layer.name(), geometry_type)
+            log.debug("Layer CRS: %s, Canvas CRS: %s", layer_crs.authid(), canvas_crs.authid())
         
         # Determine search tolerance based on geometry type
         if geometry_type == QgsWkbTypes.PointGeometry:
@@ -130,9 +287,9 @@ class FeatureDetector:
             tolerance = self.default_tolerance
         
         # Convert tolerance to map units (use canvas CRS for consistency)
-        tolerance_map_units = tolerance * self.canvas.mapUnitsPerPixel()
+        tolerance_map_units = tolerance * map_units_per_pixel
         
-        print(f"DEBUG: Using tolerance: {tolerance} pixels ({tolerance_map_units} map units)")
+        log.debug("Using tolerance: %s pixels (%s map units)", tolerance, tolerance_map_units)
         
         # Create search rectangle in canvas CRS
         search_rect = QgsRectangle(
@@ -142,290 +299,681 @@ class FeatureDetector:
             click_pt.y() + tolerance_map_units
         )
         
+        # Compare the CRSs once and keep the common same-CRS case free of any transform
+        if layer_crs == canvas_crs:
+            # Canvas coordinates and units are already layer coordinates and units
+            crs_key = None
+            transform = None
+            layer_units_per_pixel = map_units_per_pixel
+            click_pt_layer = click_pt
+            pt_geom_layer = click['pt_geom']
+        else:
+            # Transform coordinates to layer CRS
+            crs_key = layer_crs.authid() or layer_crs.toWkt()
+            transform = self._get_transform(canvas_crs, layer_crs)
+            layer_units_per_pixel = self._get_layer_units_per_pixel(transform, map_units_per_pixel)
+            try:
+                # The click point is transformed once per layer CRS and shared by the
+                # layers in that CRS
+                layer_point = click['layer_points'].get(crs_key)
+                if layer_point is None:
+                    pt_geom_layer = QgsGeometry(click['pt_geom'])
+                    pt_geom_layer.transform(transform)
+                    layer_point = (pt_geom_layer.asPoint(), pt_geom_layer)
+                    click['layer_points'][crs_key] = layer_point
+                click_pt_layer, pt_geom_layer = layer_point
+            except Exception as e:
+                log.warning("CRS transformation failed: %s", e)
+                return None
+        
+        # The search rectangle and its feature request are built once per layer CRS and
+        # tolerance, and shared by all layers with the same ones
+        rect_key = (crs_key, tolerance)
+        rect_request = click['rect_requests'].get(rect_key)
+        if rect_request is None:
+            if transform is None:
+                search_rect_layer = search_rect
+            else:
+                try:
+                    search_rect_layer = transform.transformBoundingBox(search_rect)
+                except Exception as e:
+                    log.warning("CRS transformation failed: %s", e)
+                    return None
+            
+            # Feature request in layer CRS (hit-testing only needs geometries).
+            # ExactIntersect lets the provider drop features whose bounding box
+            # touches the search rectangle but whose geometry does not.
+            request = (QgsFeatureRequest()
+                       .setFilterRect(search_rect_layer)
+                       .setFlags(QgsFeatureRequest.ExactIntersect)
+                       .setNoAttributes())
+            rect_request = (search_rect_layer, request)
+            click['rect_requests'][rect_key] = rect_request
+        search_rect_layer, request = rect_request
+        
+        # Single/multi is a property of the layer, so derive the type string once;
+        # only layers with an unknown WKB type need the per-feature detection
+        if layer.wkbType() == QgsWkbTypes.Unknown:
+            layer_geometry_type_str = None
+            layer_priority = None
+        else:
+            layer_geometry_type_str = self._get_layer_geometry_type(layer)
+            layer_priority = _TYPE_PRIORITY.get(layer_geometry_type_str, 3)
+        
+        # Single-point layers get a KD-tree that answers the radius query directly.
+        # Either index is None while it is still being built; the layer is then
+        # searched with the rectangle request meanwhile.
+        spatial_index = None
+        point_index = None
+        if self._use_spatial_index(layer, search_rect_layer):
+            if QgsSpatialIndexKDBush is not None and layer_geometry_type_str == 'point':
+                point_index = self._get_point_index(layer)
+            else:
+                spatial_index = self.get_spatial_index(layer)
+        
+        return {
+            'layer': layer,
+            'layer_name': layer.name(),
+            'source': source,
+            'click_pt': click_pt_layer,
+            'pt_geom': pt_geom_layer,
+            'request': request,
+            'point_tolerance': self.point_search_radius * layer_units_per_pixel,
+            'polygon_tolerance': self.default_tolerance * layer_units_per_pixel,
+            'spatial_index': spatial_index,
+            'point_index': point_index,
+            'geometry_type': layer_geometry_type_str,
+            'priority': layer_priority
+        }
+    
+    def _search_layer(self, layer_search: Dict) -> List[DetectedFeature]:
+        """
+        Find and hit-test the features of a prepared layer search.
+        
+        Safe to run on a worker thread when the search reads from a
+        QgsVectorLayerFeatureSource: it only iterates the feature source, queries
+        the (read-only) spatial index and runs geometry predicates, and never
+        touches the layer or any other Qt object.
+        
+        Args:
+            layer_search: Layer search parameters from _prepare_layer_search
+            
+        Returns:
+            List of detected features in the layer
+        """
+        source = layer_search['source']
+        click_pt = layer_search['click_pt']
+        pt_geom = layer_search['pt_geom']
+        detected_features = []
+        
         # Find features using CRS-agnostic method
-        if layer.featureCount() > 1000:
-            features = self._find_features_with_spatial_index_crs_agnostic(layer, click_pt, search_rect)
+        if layer_search['point_index'] is not None:
+            hits = self._find_points_with_point_index(layer_search['point_index'], click_pt,
+                                                      layer_search['point_tolerance'])
+        elif layer_search['spatial_index'] is not None:
+            hits = self._find_features_with_spatial_index(source, layer_search['spatial_index'], layer_search['request'],
+                                                          click_pt, pt_geom, layer_search['point_tolerance'],
+                                                          layer_search['polygon_tolerance'])
         else:
-            features = self._find_features_simple_crs_agnostic(layer, click_pt, search_rect)
+            hits = self._find_features_simple(source, layer_search['request'], click_pt, pt_geom,
+                                              layer_search['point_tolerance'], layer_search['polygon_tolerance'])
+        
+        log.debug("Found %d features in layer '%s'", len(hits), layer_search['layer_name'])
         
-        print(f"DEBUG: Found {len(features)} features in layer '{layer.name()}'")
+        # Hit-testing fetched geometries only - load the attributes of the hits for the actions
+        features = self._fetch_features_with_attributes(source, hits)
         
         # Convert to DetectedFeature objects
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
         for feature in features:
-            # Use detailed geometry type that includes multipoint detection
-            geometry_type_str = self._get_detailed_geometry_type(feature)
-            distance = self._calculate_distance_to_feature_crs_agnostic(feature, click_pt, layer)
+            geometry_type_str = layer_search['geometry_type']
+            priority = layer_search['priority']
+            if geometry_type_str is None:
+                # Use detailed geometry type that includes multipoint detection
+                geometry_type_str = self._get_detailed_geometry_type(feature)
+                priority = _TYPE_PRIORITY.get(geometry_type_str, 3)
+            distance = hits[feature.id()]
             
-            print(f"DEBUG: Feature ID {feature.id()} - Type: {geometry_type_str}, Distance: {distance}")
+            if debug_enabled:
+                log.debug("Feature ID %s - Type: %s, Distance: %s", feature.id(), geometry_type_str, distance)
             
             detected_feature = DetectedFeature(
                 feature=feature,
-                layer=layer,
+                layer=layer_search['layer'],
                 geometry_type=geometry_type_str,
-                distance=distance
+                distance=distance,
+                priority=priority
             )
             detected_features.append(detected_feature)
         
         return detected_features
     
-    def _find_features_simple_crs_agnostic(self, layer: QgsVectorLayer, click_pt: QgsPointXY, search_rect: QgsRectangle) -> List['QgsFeature']:
+    def _find_features_simple(self, source, request: QgsFeatureRequest, click_pt: QgsPointXY, pt_geom: QgsGeometry,
+                              point_tolerance: float, polygon_tolerance: float) -> Dict[int, float]:
         """
         CRS-agnostic feature search for smaller layers.
         Works regardless of layer CRS differences.
         
         Args:
-            layer: Vector layer to search in
-            click_pt: Click point coordinates (in canvas CRS)
-            search_rect: Search rectangle (in canvas CRS)
+            source: Feature source of the layer to search in
+            request: Search rectangle request (in layer CRS, geometries only)
+            click_pt: Click point coordinates (in layer CRS)
+            pt_geom: Point geometry for the click point (in layer CRS)
+            point_tolerance: Hit tolerance for points and lines (in layer CRS units)
+            polygon_tolerance: Hit tolerance for polygon boundaries (in layer CRS units)
             
         Returns:
-            List of features at the click point
+            Distances from the click point, keyed by the ID of each feature hit
         """
-        features = []
-        
-        # Transform click point and search rect to layer CRS if needed
-        layer_crs = layer.crs()
-        canvas_crs = self.canvas.mapSettings().destinationCrs()
-        
-        if layer_crs != canvas_crs:
-            # Transform coordinates to layer CRS
-            transform = QgsCoordinateTransform(canvas_crs, layer_crs, QgsProject.instance())
-            try:
-                click_pt_layer = transform.transform(click_pt)
-                search_rect_layer = transform.transformBoundingBox(search_rect)
-            except Exception as e:
-                print(f"DEBUG: CRS transformation failed: {e}")
-                return []
-        else:
-            click_pt_layer = click_pt
-            search_rect_layer = search_rect
+        hits = {}
         
-        # Create feature request in layer CRS
-        req = QgsFeatureRequest().setFilterRect(search_rect_layer)
-        pt_geom_layer = QgsGeometry.fromPointXY(click_pt_layer)
-        
-        for feature in layer.getFeatures(req):
+        for feature in source.getFeatures(request):
             geometry = feature.geometry()
             if not geometry:
                 continue
             
             try:
-                if self._feature_contains_point_crs_agnostic(feature, click_pt_layer, pt_geom_layer, layer):
-                    features.append(feature)
+                distance = self._feature_hit_distance(feature, click_pt, pt_geom, point_tolerance, polygon_tolerance)
+                if distance is not None:
+                    hits[feature.id()] = distance
             except Exception as e:
-                print(f"DEBUG: Feature detection error: {e}")
+                log.debug("Feature detection error: %s", e)
                 continue
         
-        return features
-    
-    def _find_features_simple(self, layer: QgsVectorLayer, click_pt: QgsPointXY, search_rect: QgsRectangle) -> List['QgsFeature']:
-        """
-        Simple feature search for smaller layers (legacy method).
-        
-        Args:
-            layer: Vector layer to search in
-            click_pt: Click point coordinates
-            search_rect: Search rectangle
-            
-        Returns:
-            List of features at the click point
-        """
-        return self._find_features_simple_crs_agnostic(layer, click_pt, search_rect)
+        return hits
     
-    def _find_features_with_spatial_index_crs_agnostic(self, layer: QgsVectorLayer, click_pt: QgsPointXY, search_rect: QgsRectangle) -> List['QgsFeature']:
+    def _find_features_with_spatial_index(self, source, spatial_index: QgsSpatialIndex, request: QgsFeatureRequest,
+                                          click_pt: QgsPointXY, pt_geom: QgsGeometry,
+                                          point_tolerance: float, polygon_tolerance: float) -> Dict[int, float]:
         """
         CRS-agnostic feature search using spatial index for better performance on large layers.
         Works regardless of layer CRS differences.
         
         Args:
-            layer: Vector layer to search in
-            click_pt: Click point coordinates (in canvas CRS)
-            search_rect: Search rectangle (in canvas CRS)
+            source: Feature source of the layer to search in
+            spatial_index: Spatial index of the layer features
+            request: Search rectangle request (in layer CRS, geometries only)
+            click_pt: Click point coordinates (in layer CRS)
+            pt_geom: Point geometry for the click point (in layer CRS)
+            point_tolerance: Hit tolerance for points and lines (in layer CRS units)
+            polygon_tolerance: Hit tolerance for polygon boundaries (in layer CRS units)
             
         Returns:
-            List of features at the click point
+            Distances from the click point, keyed by the ID of each feature hit
         """
         try:
-            # Transform coordinates to layer CRS if needed
-            layer_crs = layer.crs()
-            canvas_crs = self.canvas.mapSettings().destinationCrs()
-            
-            if layer_crs != canvas_crs:
-                # Transform coordinates to layer CRS
-                transform = QgsCoordinateTransform(canvas_crs, layer_crs, QgsProject.instance())
-                try:
-                    click_pt_layer = transform.transform(click_pt)
-                    search_rect_layer = transform.transformBoundingBox(search_rect)
-                except Exception as e:
-                    print(f"DEBUG: CRS transformation failed: {e}")
-                    return []
-            else:
-                click_pt_layer = click_pt
-                search_rect_layer = search_rect
-            
-            # Build spatial index
-            spatial_index = QgsSpatialIndex(layer.getFeatures())
-            
-            # Query spatial index for candidate features
-            candidate_fids = spatial_index.intersects(search_rect_layer)
+            # Query spatial index for candidate features, de-duplicated and in FID
+            # order so disk-based providers can read them sequentially
+            candidate_fids = sorted(set(spatial_index.intersects(request.filterRect())))
             
             if not candidate_fids:
-                return []
+                return {}
+            
+            if len(candidate_fids) > self.max_index_candidates:
+                # Fetching this many features by ID is slower than letting the provider filter the rectangle
+                log.debug("%d index candidates, using rectangle search", len(candidate_fids))
+                return self._find_features_simple(source, request, click_pt, pt_geom, point_tolerance, polygon_tolerance)
             
-            # Get features by their IDs
-            req = QgsFeatureRequest().setFilterFids(candidate_fids)
-            pt_geom_layer = QgsGeometry.fromPointXY(click_pt_layer)
-            features = []
+            # Get features by their IDs (hit-testing only needs geometries)
+            req = QgsFeatureRequest().setFilterFids(candidate_fids).setNoAttributes()
+            hits = {}
             
-            for feature in layer.getFeatures(req):
+            for feature in source.getFeatures(req):
                 geometry = feature.geometry()
                 if not geometry:
                     continue
                 
                 try:
-                    if self._feature_contains_point_crs_agnostic(feature, click_pt_layer, pt_geom_layer, layer):
-                        features.append(feature)
+                    distance = self._feature_hit_distance(feature, click_pt, pt_geom, point_tolerance, polygon_tolerance)
+                    if distance is not None:
+                        hits[feature.id()] = distance
                 except Exception as e:
-                    print(f"DEBUG: Feature detection error: {e}")
+                    log.debug("Feature detection error: %s", e)
                     continue
             
-            return features
+            return hits
             
         except Exception as e:
-            print(f"DEBUG: Spatial index search failed: {e}")
+            log.warning("Spatial index search failed: %s", e)
             # Fallback to simple search if spatial index fails
-            return self._find_features_simple_crs_agnostic(layer, click_pt, search_rect)
+            return self._find_features_simple(source, request, click_pt, pt_geom, point_tolerance, polygon_tolerance)
     
-    def _find_features_with_spatial_index(self, layer: QgsVectorLayer, click_pt: QgsPointXY, search_rect: QgsRectangle) -> List['QgsFeature']:
+    def _find_points_with_point_index(self, point_index, click_pt: QgsPointXY,
+                                      point_tolerance: float) -> Dict[int, float]:
         """
-        Feature search using spatial index for better performance on large layers (legacy method).
+        Point feature search through a KD-tree index of a single-point layer.
+        
+        The index stores the point coordinates, so the radius query is the whole
+        hit-test and no features need to be fetched.
+        
+        Args:
+            point_index: QgsSpatialIndexKDBush of the layer points
+            click_pt: Click point coordinates (in layer CRS)
+            point_tolerance: Hit tolerance for points (in layer CRS units)
+            
+        Returns:
+            Distances from the click point, keyed by the ID of each feature hit
+        """
+        return {data.id: click_pt.distance(data.point()) for data in point_index.within(click_pt, point_tolerance)}
+    
+    def _fetch_features_with_attributes(self, source, feature_ids) -> List['QgsFeature']:
+        """
+        Fetch features found without attributes, this time with all attributes.
+        
+        Args:
+            source: Feature source of the layer containing the features
+            feature_ids: IDs of the features to fetch
+            
+        Returns:
+            The features including their attributes
+        """
+        if not feature_ids:
+            return []
+        
+        req = QgsFeatureRequest().setFilterFids(list(feature_ids))
+        return list(source.getFeatures(req))
+    
+    def _get_transform(self, source_crs: QgsCoordinateReferenceSystem, dest_crs: QgsCoordinateReferenceSystem) -> QgsCoordinateTransform:
+        """
+        Get a coordinate transform between two CRSs, creating it only once per CRS pair.
+        
+        Args:
+            source_crs: CRS to transform from
+            dest_crs: CRS to transform to
+            
+        Returns:
+            Cached coordinate transform
+        """
+        # Custom CRSs have no auth ID, fall back to their WKT definition
+        key = (source_crs.authid() or source_crs.toWkt(), dest_crs.authid() or dest_crs.toWkt())
+        transform = self._xform_cache.get(key)
+        if transform is None:
+            transform = QgsCoordinateTransform(source_crs, dest_crs, QgsProject.instance())
+            self._xform_cache[key] = transform
+        return transform
+    
+    def _invalidate_transforms(self, *args):
+        """
+        Drop cached coordinate transforms after a CRS or transform context change.
+        
+        Args:
+            *args: Signal arguments (unused)
+        """
+        self._xform_cache.clear()
+    
+    def _use_spatial_index(self, layer: QgsVectorLayer, search_rect: QgsRectangle) -> bool:
+        """
+        Decide whether searching a layer through its spatial index pays off.
         
         Args:
             layer: Vector layer to search in
-            click_pt: Click point coordinates
-            search_rect: Search rectangle
+            search_rect: Search rectangle (in layer CRS)
             
         Returns:
-            List of features at the click point
+            True if the layer should be searched through its spatial index
         """
-        return self._find_features_with_spatial_index_crs_agnostic(layer, click_pt, search_rect)
+        if layer.featureCount() <= self.spatial_index_min_features:
+            return False
+        
+        # A search covering a large part of the layer gets most features back from the
+        # index, and the FID filter is then slower than the provider's own rectangle filter
+        extent_area = layer.extent().area()
+        if extent_area > 0 and search_rect.area() > self.spatial_index_max_extent_ratio * extent_area:
+            return False
+        
+        return True
     
-    def _feature_contains_point_crs_agnostic(self, feature: 'QgsFeature', click_pt: QgsPointXY, pt_geom: QgsGeometry, layer: QgsVectorLayer) -> bool:
+    def get_spatial_index(self, layer: QgsVectorLayer) -> Optional[QgsSpatialIndex]:
         """
-        CRS-agnostic check if a feature contains or intersects the clicked point.
-        Works regardless of layer CRS differences.
+        Get the spatial index for a layer, building it in the background when needed.
+        
+        The index is cached per layer and reused by later clicks until the layer's
+        features are added, deleted or moved, or its feature count changes. Building
+        can take seconds on large layers, so it runs as a QGIS task instead of
+        blocking the click.
         
         Args:
-            feature: Feature to check
-            click_pt: Click point coordinates (in layer CRS)
-            pt_geom: Point geometry for the click point (in layer CRS)
-            layer: Layer containing the feature
+            layer: Vector layer to index
             
         Returns:
-            True if feature contains the point
+            Spatial index of the layer features (in layer CRS), or None while it is
+            still being built
         """
-        geometry = feature.geometry()
-        geometry_type = geometry.type()
+        layer_id = layer.id()
+        feature_count = layer.featureCount()
         
-        # Calculate tolerance in layer CRS
-        layer_crs = layer.crs()
-        canvas_crs = self.canvas.mapSettings().destinationCrs()
+        cached = self._sindex_cache.get(layer_id)
+        if cached is not None and cached[0] == feature_count:
+            return cached[1]
         
-        if layer_crs != canvas_crs:
-            # Transform tolerance from canvas CRS to layer CRS
-            try:
-                # Create a small rectangle in canvas CRS and transform it to get scale factor
-                canvas_tolerance = self.default_tolerance * self.canvas.mapUnitsPerPixel()
-                test_rect = QgsRectangle(0, 0, canvas_tolerance, canvas_tolerance)
-                transform = QgsCoordinateTransform(canvas_crs, layer_crs, QgsProject.instance())
-                transformed_rect = transform.transformBoundingBox(test_rect)
-                tolerance_map_units = max(transformed_rect.width(), transformed_rect.height())
-            except Exception:
-                # Fallback: use a reasonable default tolerance
-                tolerance_map_units = self.default_tolerance * 0.001  # Rough approximation
-        else:
-            tolerance_map_units = self.default_tolerance * self.canvas.mapUnitsPerPixel()
+        # A stale build still running is left to finish first; a later click then
+        # starts a fresh one
+        if layer_id not in self._sindex_tasks:
+            self._start_spatial_index_build(layer, feature_count, self._sindex_cache, self._build_spatial_index)
+        return None
+    
+    def _start_spatial_index_build(self, layer: QgsVectorLayer, feature_count: int, cache: Dict, build_index):
+        """
+        Start building a spatial index of a layer in a background task.
         
-        if geometry_type == QgsWkbTypes.PointGeometry:
-            # For points, check if click is within tolerance
-            feature_point = geometry.asPoint()
-            distance = click_pt.distance(feature_point)
-            point_tolerance = self.point_search_radius * (tolerance_map_units / self.default_tolerance)
-            return distance <= point_tolerance
-        elif geometry_type == QgsWkbTypes.LineGeometry:
-            # For lines, check if click is within tolerance distance
-            distance = geometry.distance(pt_geom)
-            line_tolerance = self.point_search_radius * (tolerance_map_units / self.default_tolerance)
-            return distance <= line_tolerance
-        else:
-            # For polygons, use multiple detection methods for better reliability
-            # This helps with transparent polygons where users click on the outline
+        Args:
+            layer: Vector layer to index
+            feature_count: Feature count of the layer when the build starts
+            cache: Index cache the built index is stored in
+            build_index: Build function, called with the task, the feature source
+                and a feedback canceled together with the task
+        """
+        layer_id = layer.id()
+        
+        # The task only reads from a feature source, which is safe off the GUI thread
+        source = QgsVectorLayerFeatureSource(layer)
+        feedback = QgsFeedback()
+        task = QgsTask.fromFunction(
+            "Building spatial index for {}".format(layer.name()),
+            build_index, source, feedback,
+            on_finished=partial(self._spatial_index_built, layer_id, cache, feature_count, source),
+            flags=QgsTask.CanCancel | _TASK_SILENT
+        )
+        self._sindex_tasks[layer_id] = (source, task, feedback)
+        self._watch_layer(layer)
+        QgsApplication.taskManager().addTask(task)
+    
+    def _build_spatial_index(self, task: QgsTask, source, feedback: QgsFeedback) -> Optional[QgsSpatialIndex]:
+        """
+        Build a spatial index from a feature source (runs in a background task).
+        
+        Args:
+            task: Task running the build
+            source: Feature source of the layer to index
+            feedback: Feedback canceled with the task (unused, the task is checked)
             
-            # Method 1: Check if point is inside polygon
-            if geometry.contains(pt_geom):
-                return True
+        Returns:
+            Spatial index of the source features, None if the task was canceled
+        """
+        spatial_index = QgsSpatialIndex()
+        # addFeature replaced insertFeature in QGIS 3.4
+        add_feature = getattr(spatial_index, 'addFeature', None) or spatial_index.insertFeature
+        
+        # Only geometries are needed to build the index
+        request = QgsFeatureRequest().setNoAttributes()
+        for feature in source.getFeatures(request):
+            if task.isCanceled():
+                return None
+            add_feature(feature)
+        return spatial_index
+    
+    def _build_point_index(self, task: QgsTask, source, feedback: QgsFeedback):
+        """
+        Build the KD-tree index of a single-point feature source (runs in a background task).
+        
+        Args:
+            task: Task running the build
+            source: Feature source of the layer to index
+            feedback: Feedback canceled with the task, which stops the build
             
-            # Method 2: Check if point intersects polygon (for boundary cases)
-            if geometry.intersects(pt_geom):
-                return True
+        Returns:
+            QgsSpatialIndexKDBush of the source points, None if the task was canceled
+        """
+        # Only geometries are needed to build the index
+        request = QgsFeatureRequest().setNoAttributes()
+        point_index = QgsSpatialIndexKDBush(source.getFeatures(request), feedback)
+        if feedback.isCanceled() or task.isCanceled():
+            return None
+        return point_index
+    
+    def _spatial_index_built(self, layer_id: str, cache: Dict, feature_count: int, source,
+                             exception: Optional[Exception], spatial_index=None):
+        """
+        Cache a spatial index built in the background (runs on the GUI thread).
+        
+        Args:
+            layer_id: ID of the indexed layer
+            cache: Index cache to store the built index in
+            feature_count: Feature count of the layer when the build started
+            source: Feature source the index was built from
+            exception: Exception raised by the build, if any
+            spatial_index: Built index, None if the build failed or was canceled
+        """
+        build = self._sindex_tasks.get(layer_id)
+        if build is None or build[0] is not source:
+            return
+        del self._sindex_tasks[layer_id]
+        
+        # An index whose layer changed during the build, or whose build was
+        # canceled by cleanup, is stale
+        if layer_id in self._stale_sindex_builds:
+            self._stale_sindex_builds.discard(layer_id)
+            return
+        
+        if exception is not None:
+            log.warning("Spatial index build failed for layer %s: %s", layer_id, exception)
+            return
+        if spatial_index is not None:
+            cache[layer_id] = (feature_count, spatial_index)
+    
+    def _get_point_index(self, layer: QgsVectorLayer):
+        """
+        Get the KD-tree index of a single-point layer, building it in the background
+        when needed.
+        
+        Cached and invalidated like the spatial indexes of get_spatial_index.
+        
+        Args:
+            layer: Single-point vector layer to index
             
-            # Method 3: Check if point is within tolerance of polygon boundary
-            # This is crucial for transparent polygons where users click on outlines
+        Returns:
+            QgsSpatialIndexKDBush of the layer points (in layer CRS), or None while it
+            is still being built
+        """
+        layer_id = layer.id()
+        feature_count = layer.featureCount()
+        
+        cached = self._point_index_cache.get(layer_id)
+        if cached is not None and cached[0] == feature_count:
+            return cached[1]
+        
+        if layer_id not in self._sindex_tasks:
+            self._start_spatial_index_build(layer, feature_count, self._point_index_cache, self._build_point_index)
+        return None
+    
+    def _watch_layer(self, layer: QgsVectorLayer):
+        """
+        Connect layer change signals that invalidate the cached spatial index.
+        
+        Args:
+            layer: Vector layer to watch
+        """
+        layer_id = layer.id()
+        if layer_id in self._sindex_watched_layers:
+            return
+        
+        slot = partial(self._invalidate_spatial_index, layer_id)
+        layer.featureAdded.connect(slot)
+        layer.featuresDeleted.connect(slot)
+        layer.geometryChanged.connect(slot)
+        layer.dataChanged.connect(slot)
+        layer.willBeDeleted.connect(slot)
+        self._sindex_watched_layers[layer_id] = (layer, slot)
+    
+    def _invalidate_spatial_index(self, layer_id: str, *args):
+        """
+        Drop the cached spatial indexes of a layer.
+        
+        Args:
+            layer_id: ID of the layer whose index is stale
+            *args: Signal arguments (unused)
+        """
+        self._sindex_cache.pop(layer_id, None)
+        self._point_index_cache.pop(layer_id, None)
+        
+        # A running build may already have read the old features: stop it, but keep
+        # its entry (and so the task) until it finishes
+        build = self._sindex_tasks.get(layer_id)
+        if build is not None:
+            self._stale_sindex_builds.add(layer_id)
+            self._cancel_build(build)
+    
+    def _cancel_build(self, build: Tuple):
+        """
+        Cancel a background index build.
+        
+        Args:
+            build: (feature source, task, feedback) of the build
+        """
+        source, task, feedback = build
+        feedback.cancel()
+        try:
+            task.cancel()
+        except RuntimeError:
+            # Task already finished and deleted by the task manager
+            pass
+    
+    def cleanup(self):
+        """
+        Disconnect layer and project signals, stop the worker threads and index
+        builds, and release cached layers, spatial indexes and transforms.
+        """
+        self._pool.shutdown(wait=True)
+        
+        try:
+            project = QgsProject.instance()
+            project.crsChanged.disconnect(self._invalidate_transforms)
+            project.transformContextChanged.disconnect(self._invalidate_transforms)
+            self.canvas.destinationCrsChanged.disconnect(self._invalidate_transforms)
+        except (RuntimeError, TypeError):
+            # Signals already disconnected
+            pass
+        self._xform_cache.clear()
+        
+        try:
+            project = QgsProject.instance()
+            self._layer_tree_root.visibilityChanged.disconnect(self._invalidate_visible_layers)
+            self._layer_tree_root.addedChildren.disconnect(self._invalidate_visible_layers)
+            self._layer_tree_root.removedChildren.disconnect(self._invalidate_visible_layers)
+            project.layersAdded.disconnect(self._invalidate_visible_layers)
+            project.layersRemoved.disconnect(self._invalidate_visible_layers)
+            project.cleared.disconnect(self._invalidate_visible_layers)
+        except (RuntimeError, TypeError):
+            # Signals already disconnected
+            pass
+        self._visible_layers_cache = None
+        
+        for layer, slot in self._sindex_watched_layers.values():
             try:
-                distance = geometry.distance(pt_geom)
-                return distance <= tolerance_map_units
-            except Exception:
-                # Fallback: if distance calculation fails, use intersects as last resort
-                return geometry.intersects(pt_geom)
+                layer.featureAdded.disconnect(slot)
+                layer.featuresDeleted.disconnect(slot)
+                layer.geometryChanged.disconnect(slot)
+                layer.dataChanged.disconnect(slot)
+                layer.willBeDeleted.disconnect(slot)
+            except (RuntimeError, TypeError):
+                # Layer already deleted or signals already disconnected
+                pass
+        self._sindex_watched_layers.clear()
+        
+        # Running builds keep their entries until they finish and discard their result
+        for layer_id, build in self._sindex_tasks.items():
+            self._stale_sindex_builds.add(layer_id)
+            self._cancel_build(build)
+        self._sindex_cache.clear()
+        self._point_index_cache.clear()
+    
+    def _get_layer_units_per_pixel(self, transform: QgsCoordinateTransform, map_units_per_pixel: float) -> float:
+        """
+        Get the size of one canvas pixel in the units of a layer with a different CRS.
+        
+        Args:
+            transform: Transform from the canvas CRS to the layer CRS
+            map_units_per_pixel: Canvas map units per pixel
+            
+        Returns:
+            Layer CRS units per canvas pixel
+        """
+        # Transform tolerance from canvas CRS to layer CRS
+        try:
+            # Create a small rectangle in canvas CRS and transform it to get scale factor
+            canvas_tolerance = self.default_tolerance * map_units_per_pixel
+            test_rect = QgsRectangle(0, 0, canvas_tolerance, canvas_tolerance)
+            transformed_rect = transform.transformBoundingBox(test_rect)
+            return max(transformed_rect.width(), transformed_rect.height()) / self.default_tolerance
+        except Exception:
+            # Fallback: use a reasonable default tolerance
+            return 0.001  # Rough approximation
     
-    def _feature_contains_point(self, feature: 'QgsFeature', click_pt: QgsPointXY, pt_geom: QgsGeometry) -> bool:
+    def _feature_hit_distance(self, feature: 'QgsFeature', click_pt: QgsPointXY, pt_geom: QgsGeometry,
+                              point_tolerance: float, polygon_tolerance: float) -> Optional[float]:
         """
-        Check if a feature contains or intersects the clicked point (legacy method).
+        CRS-agnostic check if a feature contains or is near the clicked point.
+        Works regardless of layer CRS differences.
+        
+        The distance used for the check is returned, so detected features do not
+        need a second distance calculation.
         
         Args:
             feature: Feature to check
-            click_pt: Click point coordinates
-            pt_geom: Point geometry for the click point
+            click_pt: Click point coordinates (in layer CRS)
+            pt_geom: Point geometry for the click point (in layer CRS)
+            point_tolerance: Hit tolerance for points and lines (in layer CRS units)
+            polygon_tolerance: Hit tolerance for polygon boundaries (in layer CRS units)
             
         Returns:
-            True if feature contains the point
+            Distance from the click point to the feature (in layer CRS units), or
+            None if the feature is not hit
         """
-        # This is a simplified version for backward compatibility
         geometry = feature.geometry()
         geometry_type = geometry.type()
         
         if geometry_type == QgsWkbTypes.PointGeometry:
-            # For points, check if click is within tolerance
-            feature_point = geometry.asPoint()
-            distance = click_pt.distance(feature_point)
-            tolerance_map_units = self.point_search_radius * self.canvas.mapUnitsPerPixel()
-            return distance <= tolerance_map_units
+            # For points, check if click is within tolerance (plain coordinate math, no GEOS)
+            if geometry.isMultipart():
+                distance = min((click_pt.distance(point) for point in geometry.asMultiPoint()), default=math.inf)
+            else:
+                distance = click_pt.distance(geometry.asPoint())
+            return distance if distance <= point_tolerance else None
         elif geometry_type == QgsWkbTypes.LineGeometry:
             # For lines, check if click is within tolerance distance
             distance = geometry.distance(pt_geom)
-            tolerance_map_units = self.point_search_radius * self.canvas.mapUnitsPerPixel()
-            return distance <= tolerance_map_units
+            return distance if distance <= point_tolerance else None
         else:
             # For polygons, use multiple detection methods for better reliability
             # This helps with transparent polygons where users click on the outline
             
-            # Method 1: Check if point is inside polygon
-            if geometry.contains(pt_geom):
-                return True
-            
-            # Method 2: Check if point intersects polygon (for boundary cases)
-            if geometry.intersects(pt_geom):
-                return True
+            # Cheap envelope test first: a point outside the bounding box cannot be inside
+            # the polygon, and cannot be near its boundary if it is too far from the box
+            bbox = geometry.boundingBox()
+            if bbox.contains(click_pt):
+                # Method 1: Check if point is inside polygon
+                if geometry.contains(pt_geom):
+                    return 0.0
+                
+                # Method 2: Check if point intersects polygon (for boundary cases)
+                if geometry.intersects(pt_geom):
+                    return 0.0
+            elif self._distance_to_rectangle(bbox, click_pt) > polygon_tolerance:
+                return None
             
             # Method 3: Check if point is within tolerance of polygon boundary
             # This is crucial for transparent polygons where users click on outlines
             try:
                 distance = geometry.distance(pt_geom)
-                tolerance_map_units = self.default_tolerance * self.canvas.mapUnitsPerPixel()
-                return distance <= tolerance_map_units
+                return distance if distance <= polygon_tolerance else None
             except Exception:
                 # Fallback: if distance calculation fails, use intersects as last resort
-                return geometry.intersects(pt_geom)
+                return 0.0 if geometry.intersects(pt_geom) else None
+    
+    def _distance_to_rectangle(self, rect: QgsRectangle, point: QgsPointXY) -> float:
+        """
+        Calculate the distance from a point to a rectangle (zero when inside).
+        
+        Args:
+            rect: Rectangle to measure to
+            point: Point to measure from
+            
+        Returns:
+            Distance in the units of the rectangle and point
+        """
+        dx = max(rect.xMinimum() - point.x(), 0.0, point.x() - rect.xMaximum())
+        dy = max(rect.yMinimum() - point.y(), 0.0, point.y() - rect.yMaximum())
+        return math.hypot(dx, dy)
     
     def _get_geometry_type_string(self, geometry_type: QgsWkbTypes.GeometryType) -> str:
         """
@@ -446,6 +994,21 @@ class FeatureDetector:
         else:
             return 'unknown'
     
+    def _get_layer_geometry_type(self, layer: QgsVectorLayer) -> str:
+        """
+        Get detailed geometry type of a layer from its WKB type.
+        
+        Args:
+            layer: Layer to analyze
+            
+        Returns:
+            Detailed geometry type string
+        """
+        geometry_type_str = self._get_geometry_type_string(layer.geometryType())
+        if geometry_type_str != 'unknown' and QgsWkbTypes.isMultiType(layer.wkbType()):
+            return 'multi' + geometry_type_str
+        return geometry_type_str
+    
     def _get_detailed_geometry_type(self, feature: 'QgsFeature') -> str:
         """
         Get detailed geometry type including multipoint detection.
@@ -483,63 +1046,6 @@ class FeatureDetector:
         else:
             return 'unknown'
     
-    def _calculate_distance_to_feature_crs_agnostic(self, feature: 'QgsFeature', click_pt: QgsPointXY, layer: QgsVectorLayer) -> float:
-        """
-        CRS-agnostic calculation of distance from click point to feature.
-        Works regardless of layer CRS differences.
-        
-        Args:
-            feature: Feature to calculate distance to
-            click_pt: Click point coordinates (in layer CRS)
-            layer: Layer containing the feature
-            
-        Returns:
-            Distance in map units
-        """
-        geometry = feature.geometry()
-        if not geometry:
-            return float('inf')
-        
-        try:
-            if geometry.type() == QgsWkbTypes.PointGeometry:
-                # For points, calculate direct distance
-                feature_point = geometry.asPoint()
-                return click_pt.distance(feature_point)
-            else:
-                # For lines and polygons, calculate distance to geometry
-                pt_geom = QgsGeometry.fromPointXY(click_pt)
-                return geometry.distance(pt_geom)
-        except Exception as e:
-            print(f"DEBUG: Distance calculation error: {e}")
-            return float('inf')
-    
-    def _calculate_distance_to_feature(self, feature: 'QgsFeature', click_pt: QgsPointXY) -> float:
-        """
-        Calculate distance from click point to feature (legacy method).
-        
-        Args:
-            feature: Feature to calculate distance to
-            click_pt: Click point coordinates
-            
-        Returns:
-            Distance in map units
-        """
-        geometry = feature.geometry()
-        if not geometry:
-            return float('inf')
-        
-        try:
-            if geometry.type() == QgsWkbTypes.PointGeometry:
-                # For points, calculate direct distance
-                feature_point = geometry.asPoint()
-                return click_pt.distance(feature_point)
-            else:
-                # For lines and polygons, calculate distance to geometry
-                pt_geom = QgsGeometry.fromPointXY(click_pt)
-                return geometry.distance(pt_geom)
-        except Exception:
-            return float('inf')
-    
     def _sort_features_by_priority(self, features: List[DetectedFeature]) -> List[DetectedFeature]:
         """
         Sort features by priority: points first (closest), then lines, then polygons.
@@ -550,16 +1056,7 @@ class FeatureDetector:
         Returns:
             Sorted list of features
         """
-        def priority_key(feature: DetectedFeature) -> Tuple[int, float]:
-            # Priority order: points (0), multipoints (0), lines (1), multilines (1), polygons (2), multipolygons (2)
-            type_priority = {
-                'point': 0, 'multipoint': 0,
-                'line': 1, 'multiline': 1,
-                'polygon': 2, 'multipolygon': 2
-            }.get(feature.geometry_type, 3)
-            return (type_priority, feature.distance)
-        
-        return sorted(features, key=priority_key)
+        return sorted(features, key=attrgetter('priority', 'distance'))
     
     def get_click_context(self, event: QgsMapMouseEvent) -> Dict:
         """
@@ -586,16 +1083,24 @@ class FeatureDetector:
                 else:
                     click_type = 'mixed'
             
-            return {
+            context = {
                 'click_point': click_pt,
                 'click_type': click_type,
                 'detected_features': detected_features,
                 'has_features': len(detected_features) > 0,
                 'feature_count': len(detected_features)
             }
+            
+            # A single hit is the target of every action in the menu, so expose it
+            # directly and let the menu builder use this context without copying it
+            if len(detected_features) == 1:
+                context['feature'] = detected_features[0].feature
+                context['layer'] = detected_features[0].layer
+            
+            return context
         except Exception as e:
             # Return a safe fallback context in case of errors
-            print(f"Error in get_click_context: {e}")
+            log.warning("Error in get_click_context: %s", e)
             return {
                 'click_point': event.mapPoint() if event else None,
                 'click_type': 'canvas',
@@ -7,11 +7,14 @@ on polygon features and displays a context menu with available options.
 
 from qgis.PyQt.QtWidgets import QAction, QMenu, QDialog, QVBoxLayout, QLabel, QPushButton
 from qgis.PyQt.QtCore import Qt
+from qgis.PyQt import sip
 from qgis.core import (
     QgsVectorLayer, QgsFeatureRequest, QgsRectangle,
-    QgsWkbTypes, QgsGeometry, QgsPointXY, QgsSpatialIndex
+    QgsWkbTypes, QgsGeometry, QgsPointXY
 )
 from qgis.gui import QgsMapMouseEvent
+from collections import namedtuple
+from functools import partial
 
 from .action_registry import ActionRegistry
 from .settings_dialog import SettingsDialog
@@ -19,6 +22,12 @@ from .feature_detector import FeatureDetector
 from .context_menu_builder import ContextMenuBuilder
 from .custom_menu_provider import CustomMenuProvider
 
+# Candidates fetched by the first, limited request of the simple legacy search
+_FIRST_BATCH_SIZE = 32
+
+# Action registered through register_legacy_action()
+RegAction = namedtuple('RegAction', 'name callback')
+
 
 class RightClickUtilities:
     """
@@ -39,6 +48,9 @@ class RightClickUtilities:
     # Class-level flag to track if plugin is already initialized
     _initialized = False
     
+    # Plugin menu from the last initGui, so a reload can clear it without scanning the menubar
+    _cached_plugin_menu = None
+    
     def __init__(self, iface):
         """
         Initialize the plugin.
@@ -61,7 +73,9 @@ class RightClickUtilities:
         self.context_menu_builder = ContextMenuBuilder(self.action_registry)
         
         # Initialize custom menu provider
-        self.custom_menu_provider = CustomMenuProvider(self.context_menu_builder, self.iface, self.canvas)
+        self.custom_menu_provider = CustomMenuProvider(
+            self.context_menu_builder, self.iface, self.canvas, self.feature_detector
+        )
         
         # Legacy extension hooks (kept for backward compatibility)
         self._registered_actions = []
@@ -81,16 +95,20 @@ class RightClickUtilities:
         
         # First, try to clean up any existing menu items (in case of reload)
         try:
-            # This is a bit aggressive but should help with reload issues
-            from qgis.PyQt.QtWidgets import QMenuBar
-            menubar = self.iface.mainWindow().menuBar()
-            for action in menubar.actions():
-                if action.text() == "&Right-click Actions Toolkit":
-                    # Found the menu, try to clear it
-                    menu = action.menu()
-                    if menu:
-                        menu.clear()
-                    break
+            cached_menu = RightClickUtilities._cached_plugin_menu
+            if cached_menu is not None and not sip.isdeleted(cached_menu):
+                # Menu kept from the previous initialization, clear it directly
+                cached_menu.clear()
+            else:
+                # This is a bit aggressive but should help with reload issues
+                menubar = self.iface.mainWindow().menuBar()
+                for action in menubar.actions():
+                    if action.text() == "&Right-click Actions Toolkit":
+                        # Found the menu, try to clear it
+                        menu = action.menu()
+                        if menu:
+                            menu.clear()
+                        break
         except Exception as e:
             print(f"RightClickUtilities: Error during cleanup: {e}")
         
@@ -100,6 +118,11 @@ class RightClickUtilities:
         self.action.triggered.connect(self.show_settings_dialog)
         self.iface.addPluginToMenu("&Right-click Actions Toolkit", self.action)
         
+        # Remember the menu the action was added to for the next reload
+        RightClickUtilities._cached_plugin_menu = next(
+            (widget for widget in self.action.associatedWidgets() if isinstance(widget, QMenu)), None
+        )
+        
         # Remove the separate settings action since main action now opens settings directly
         self.settings_action = None
         
@@ -130,6 +153,10 @@ class RightClickUtilities:
         if hasattr(self, 'custom_menu_provider') and self.custom_menu_provider is not None:
             self.custom_menu_provider.cleanup()
         
+        # Release cached spatial indexes and their layer signal connections
+        if hasattr(self, 'feature_detector') and self.feature_detector is not None:
+            self.feature_detector.cleanup()
+        
         # Clear registered actions
         self._registered_actions.clear()
         self._context_callbacks.clear()
@@ -207,13 +234,30 @@ class RightClickUtilities:
             search_rect (QgsRectangle): Search rectangle for initial filtering
             
         Returns:
-            QgsFeature or None: The feature containing the point, or None if not found
+            QgsFeature or None: The feature containing the point (with its attributes), or None if not found
         """
+        feature_count = layer.featureCount()
+        
+        # Nothing to search when the layer is empty or the click is outside its extent.
+        # The click is in canvas CRS, so compare it with the extent in that CRS.
+        if feature_count == 0:
+            return None
+        layer_extent = self.canvas.mapSettings().layerExtentToOutputExtent(layer, layer.extent())
+        if not layer_extent.contains(click_pt):
+            return None
+        
         # Use spatial index for better performance on large layers
-        if layer.featureCount() > 1000:
-            return self._find_feature_with_spatial_index(layer, click_pt, search_rect)
+        if feature_count > 1000:
+            feature = self._find_feature_with_spatial_index(layer, click_pt, search_rect)
         else:
-            return self._find_feature_simple(layer, click_pt, search_rect)
+            feature = self._find_feature_simple(layer, click_pt, search_rect)
+        
+        if feature is None:
+            return None
+        
+        # Candidates are hit-tested without attributes; fetch them for the clicked feature only
+        req = QgsFeatureRequest().setFilterFid(feature.id())
+        return next(layer.getFeatures(req), feature)
             
     def _find_feature_simple(self, layer, click_pt, search_rect):
         """
@@ -227,24 +271,57 @@ class RightClickUtilities:
         Returns:
             QgsFeature or None: The feature containing the point
         """
-        # Request candidate features using bounding box filter
-        req = QgsFeatureRequest().setFilterRect(search_rect)
+        # Request candidate features using bounding box filter (geometries only). The
+        # first batch is limited so the provider can stop streaming early; the search
+        # rectangle is tight, so the clicked feature is almost always in it.
+        req = QgsFeatureRequest().setFilterRect(search_rect).setNoAttributes().setLimit(_FIRST_BATCH_SIZE)
+        
+        # Point geometry for the check, shared by all candidates
+        pt_geom = QgsGeometry.fromPointXY(click_pt)
+        
+        tested_fids = set()
+        feature = self._first_feature_hit(layer.getFeatures(req), click_pt, pt_geom, tested_fids)
+        if feature is not None or len(tested_fids) < _FIRST_BATCH_SIZE:
+            return feature
+            
+        # More candidates than the first batch: scan the rest of the rectangle
+        req.setLimit(-1)
+        return self._first_feature_hit(layer.getFeatures(req), click_pt, pt_geom, tested_fids)
+        
+    def _first_feature_hit(self, features, click_pt, pt_geom, tested_fids):
+        """
+        Find the first polygon of an iterator that contains the clicked point.
+        
+        The legacy lookup only searches polygon layers.
         
-        for feature in layer.getFeatures(req):
+        Args:
+            features (QgsFeatureIterator): Candidate features from the search rectangle
+            click_pt (QgsPointXY): The clicked point
+            pt_geom (QgsGeometry): Point geometry of the clicked point
+            tested_fids (set): IDs of the features already tested; skipped, and
+                updated with the features tested here
+            
+        Returns:
+            QgsFeature or None: The feature hit by the click
+        """
+        for feature in features:
+            fid = feature.id()
+            if fid in tested_fids:
+                continue
+            tested_fids.add(fid)
+            
             geometry = feature.geometry()
             if not geometry:
                 continue
-                
-            # Create point geometry for the check
-            pt_geom = QgsGeometry.fromPointXY(click_pt)
             
-            try:
-                # Check if the feature contains or intersects the clicked point
-                if geometry.contains(pt_geom) or geometry.intersects(pt_geom):
-                    return feature
-            except Exception:
-                # Handle geometry validity issues gracefully
+            # Cheap envelope rejection before the GEOS test
+            if not geometry.boundingBox().contains(click_pt):
                 continue
+            
+            # Check if the feature intersects the clicked point (this includes containing it).
+            # GEOS errors on invalid geometries are handled by QGIS and just return False.
+            if geometry.intersects(pt_geom):
+                return feature
                 
         return None
         
@@ -261,34 +338,64 @@ class RightClickUtilities:
             QgsFeature or None: The feature containing the point
         """
         try:
-            # Build spatial index
-            spatial_index = QgsSpatialIndex(layer.getFeatures())
-            
-            # Query spatial index for candidate features
-            candidate_fids = spatial_index.intersects(search_rect)
-            
-            if not candidate_fids:
-                return None
-                
-            # Get features by their IDs
-            req = QgsFeatureRequest().setFilterFids(candidate_fids)
+            # Reuse the detector's per-layer index cache instead of indexing the whole layer on every click
+            spatial_index = self.feature_detector.get_spatial_index(layer)
+            if spatial_index is None:
+                # Index still being built in the background
+                return self._find_feature_simple(layer, click_pt, search_rect)
             pt_geom = QgsGeometry.fromPointXY(click_pt)
             
-            for feature in layer.getFeatures(req):
-                geometry = feature.geometry()
-                if not geometry:
-                    continue
-                    
-                try:
-                    if geometry.contains(pt_geom) or geometry.intersects(pt_geom):
-                        return feature
-                except Exception:
-                    continue
+            # Test the few features whose bounding boxes are nearest to the click first;
+            # a polygon containing the click has a bounding box at distance 0
+            nearest_fids = spatial_index.nearestNeighbor(click_pt, 8)
+            feature = self._find_feature_in_candidates(layer, nearest_fids, click_pt, pt_geom)
+            if feature is not None:
+                return feature
+            
+            # Query spatial index for the remaining candidate features
+            tested_fids = set(nearest_fids)
+            candidate_fids = [fid for fid in spatial_index.intersects(search_rect) if fid not in tested_fids]
+            return self._find_feature_in_candidates(layer, candidate_fids, click_pt, pt_geom)
                     
         except Exception:
             # Fallback to simple search if spatial index fails
             return self._find_feature_simple(layer, click_pt, search_rect)
+        
+    def _find_feature_in_candidates(self, layer, candidate_fids, click_pt, pt_geom):
+        """
+        Find the first candidate feature, in the given order, that contains the clicked point.
+        
+        Args:
+            layer (QgsVectorLayer): The layer to search in
+            candidate_fids (list): IDs of the candidate features, in test order
+            click_pt (QgsPointXY): The clicked point
+            pt_geom (QgsGeometry): Point geometry of the clicked point
             
+        Returns:
+            QgsFeature or None: The feature containing the point
+        """
+        if not candidate_fids:
+            return None
+            
+        # Get features by their IDs (geometries only); the provider may return them in any order
+        req = QgsFeatureRequest().setFilterFids(candidate_fids).setNoAttributes()
+        features = {feature.id(): feature for feature in layer.getFeatures(req)}
+        
+        for fid in candidate_fids:
+            feature = features.get(fid)
+            if feature is None:
+                continue
+            geometry = feature.geometry()
+            if not geometry:
+                continue
+                
+            # Cheap envelope rejection before the GEOS test
+            if not geometry.boundingBox().contains(click_pt):
+                continue
+            
+            if geometry.intersects(pt_geom):
+                return feature
+                
         return None
         
     def _add_registry_actions(self, menu, enabled_actions, context):
@@ -300,13 +407,10 @@ class RightClickUtilities:
             enabled_actions (list): List of enabled BaseAction instances
             context (dict): Context containing feature, layer, canvas, and map_point
         """
-        # Group actions by category
+        # Group actions by category, in the order categories are first seen
         categories = {}
         for action in enabled_actions:
-            category = action.category or 'Other'
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(action)
+            categories.setdefault(action.category or 'Other', []).append(action)
         
         # Add actions grouped by category
         for category, actions in categories.items():
@@ -315,16 +419,12 @@ class RightClickUtilities:
                 category_menu = menu.addMenu(category)
                 for action in actions:
                     action_item = category_menu.addAction(action.name)
-                    action_item.triggered.connect(
-                        lambda checked, action_obj=action: action_obj.execute(context)
-                    )
+                    action_item.triggered.connect(partial(self._execute_registry_action, action, context))
             else:
                 # Add actions directly to main menu
                 for action in actions:
                     action_item = menu.addAction(action.name)
-                    action_item.triggered.connect(
-                        lambda checked, action_obj=action: action_obj.execute(context)
-                    )
+                    action_item.triggered.connect(partial(self._execute_registry_action, action, context))
         
     def _add_registered_actions(self, menu, feature, layer, click_pt):
         """
@@ -337,11 +437,35 @@ class RightClickUtilities:
             click_pt (QgsPointXY): The clicked point
         """
         for action_info in self._registered_actions:
-            action = menu.addAction(action_info['name'])
+            action = menu.addAction(action_info.name)
             action.triggered.connect(
-                lambda checked, info=action_info: info['callback'](feature, layer, click_pt)
+                partial(self._call_registered_action, action_info.callback, feature, layer, click_pt)
             )
             
+    def _execute_registry_action(self, action, context, checked=False):
+        """
+        Execute a registry action from a menu trigger.
+        
+        Args:
+            action (BaseAction): The action to execute
+            context (dict): Context containing feature, layer, canvas, and map_point
+            checked (bool): Checked state sent by QAction.triggered (unused)
+        """
+        action.execute(context)
+        
+    def _call_registered_action(self, callback, feature, layer, click_pt, checked=False):
+        """
+        Call a legacy registered action from a menu trigger.
+        
+        Args:
+            callback (callable): The registered action callback
+            feature (QgsFeature): The clicked feature
+            layer (QgsVectorLayer): The active layer
+            click_pt (QgsPointXY): The clicked point
+            checked (bool): Checked state sent by QAction.triggered (unused)
+        """
+        callback(feature, layer, click_pt)
+            
     def _show_placeholder_dialog(self, feature, layer):
         """
         Show a placeholder dialog for future functionality.
@@ -450,10 +574,7 @@ class RightClickUtilities:
             callback (callable): Function to call when action is triggered.
                                Should accept (feature, layer, click_pt) parameters.
         """
-        self._registered_actions.append({
-            'name': name,
-            'callback': callback
-        })
+        self._registered_actions.append(RegAction(name, callback))
         
     def register_context_callback(self, callback):
         """
@@ -472,7 +593,7 @@ class RightClickUtilities:
         Returns:
             list: List of registered action dictionaries
         """
-        return self._registered_actions.copy()
+        return [dict(action_info._asdict()) for action_info in self._registered_actions]
         
     def clear_registered_actions(self):
         """
@@ -6,14 +6,241 @@ individual right-click actions and configure the plugin behavior.
 """
 
 from qgis.PyQt.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, 
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QCheckBox, 
     QPushButton, QGroupBox, QScrollArea, QWidget, QMessageBox,
     QTabWidget, QTabBar, QFrame, QLineEdit, QSpinBox, QDoubleSpinBox,
     QComboBox, QFileDialog, QColorDialog, QSlider, QTextEdit,
-    QSplitter, QTreeWidget, QTreeWidgetItem, QHeaderView
+    QSplitter, QTreeWidget, QTreeWidgetItem, QHeaderView, QButtonGroup
 )
 from qgis.PyQt.QtCore import Qt, QSettings, pyqtSignal
 from qgis.PyQt.QtGui import QFont, QColor
+from functools import partial
+
+
+# Stylesheet of the settings dialogs, applied once per dialog. Widgets opt in to its
+# rules through their "class" property instead of parsing a stylesheet of their own.
+_QSS = """
+    QFrame[class="mainCat"] {
+        border: 2px solid #4CAF50;
+        border-radius: 6px;
+        margin: 4px 0px;
+        padding: 4px;
+        background-color: #f1f8f4;
+    }
+    QFrame[class="mainCat"]:hover {
+        background-color: #e8f5e9;
+    }
+    QFrame[class="subCat"] {
+        border: 1px solid #2196F3;
+        border-radius: 4px;
+        margin: 2px 0px;
+        padding: 4px;
+        background-color: #e3f2fd;
+    }
+    QFrame[class="subCat"]:hover {
+        background-color: #bbdefb;
+    }
+    QFrame[class="action"] {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        margin: 2px;
+        padding: 4px;
+        background-color: #fafafa;
+    }
+    QFrame[class="action"]:hover {
+        background-color: #f5f5f5;
+    }
+    QPushButton[class="expand"] {
+        border: none;
+        background-color: transparent;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 0px;
+    }
+    QPushButton[class="expand"]:hover {
+        background-color: rgba(0, 0, 0, 0.1);
+        border-radius: 3px;
+    }
+    QPushButton[class="expandAction"] {
+        border: none;
+        background-color: transparent;
+        font-size: 10px;
+        padding: 0px;
+    }
+    QPushButton[class="expandAction"]:hover {
+        background-color: #e0e0e0;
+        border-radius: 2px;
+    }
+    QPushButton[class="reset"], QPushButton[class="resetCompact"] {
+        background-color: #ff9800;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton[class="resetCompact"], QPushButton[class="settings"] {
+        padding: 6px 12px;
+        border-radius: 3px;
+    }
+    QPushButton[class="settings"] {
+        background-color: #ff9800;
+        color: white;
+        border: none;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton[class="reset"]:hover, QPushButton[class="resetCompact"]:hover, QPushButton[class="settings"]:hover {
+        background-color: #f57c00;
+    }
+    QPushButton[class="reset"]:pressed, QPushButton[class="resetCompact"]:pressed, QPushButton[class="settings"]:pressed {
+        background-color: #ef6c00;
+    }
+    QPushButton[class="colorSwatch"] {
+        border: 1px solid #ccc;
+    }
+    QPushButton[class="close"] {
+        background-color: #2196f3;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton[class="close"]:hover {
+        background-color: #1976d2;
+    }
+    QPushButton[class="close"]:pressed {
+        background-color: #1565c0;
+    }
+    QCheckBox[class="actionToggle"] {
+        font-weight: bold;
+    }
+    QLabel[class="actionDescription"] {
+        color: #666;
+        font-size: 11px;
+    }
+    QLabel[class="settingLabel"] {
+        font-weight: bold;
+        margin-top: 10px;
+    }
+    QLabel[class="settingDescription"] {
+        color: #666;
+        font-size: 11px;
+        margin-bottom: 5px;
+    }
+    QLabel[class="tabDescription"] {
+        color: #666;
+        margin-bottom: 10px;
+    }
+    QLabel[class="windowDescription"] {
+        color: #666;
+        margin-bottom: 15px;
+        padding: 10px;
+        background-color: #f5f5f5;
+        border-radius: 4px;
+    }
+    QLabel[class="explanation"] {
+        color: #888;
+        font-size: 11px;
+        margin-top: 5px;
+    }
+    QLabel[class="emptyNote"] {
+        color: #999;
+        font-style: italic;
+    }
+    QLabel[class="warning"] {
+        color: #d84315;
+        font-weight: bold;
+        font-size: 12px;
+        background-color: #ffebee;
+        border: 1px solid #ffcdd2;
+        border-radius: 4px;
+        padding: 10px;
+        margin-bottom: 15px;
+    }
+"""
+
+# Bold title fonts by point size, shared by all labels of that size
+_bold_fonts = {}
+
+
+def get_bold_font(point_size):
+    """
+    Get the shared bold font of a point size.
+    
+    Fonts are created on first use, once a QApplication exists, and Qt shares
+    their data implicitly between the labels they are set on.
+    
+    Args:
+        point_size (int): The font point size
+        
+    Returns:
+        QFont: The bold font
+    """
+    font = _bold_fonts.get(point_size)
+    if font is None:
+        font = _bold_fonts[point_size] = QFont()
+        font.setBold(True)
+        font.setPointSize(point_size)
+    return font
+
+
+# Main categories of the "All" tab, in priority order: an action goes into the
+# first category whose click types it supports
+_MAIN_CATEGORY_RULES = (
+    ('Universal RAT', ('universal',)),
+    ('Canvas RAT', ('canvas',)),
+    ('Polygon RAT', ('polygon', 'multipolygon')),
+    ('Line RAT', ('line', 'multiline')),
+    ('Point RAT', ('point', 'multipoint')),
+)
+
+# Display order of the main categories in the "All" tab
+_CATEGORY_RANK = {
+    name: rank for rank, name in enumerate(
+        ('Point RAT', 'Line RAT', 'Polygon RAT', 'Canvas RAT', 'Universal RAT', 'Other')
+    )
+}
+
+
+def get_main_category(action):
+    """
+    Get the main category an action is listed under in the "All" tab.
+    
+    Args:
+        action: The action to categorize
+        
+    Returns:
+        str: The main category, or 'Other' if no click type matches
+    """
+    supported_click_types = action.supported_click_types
+    for main_category, click_types in _MAIN_CATEGORY_RULES:
+        if any(ct in supported_click_types for ct in click_types):
+            return main_category
+    return 'Other'
+
+
+# Settings schemas by action class. Schemas are static per class, so each is built
+# once however often the dialogs are opened.
+_schema_cache = {}
+
+
+def get_cached_settings_schema(action):
+    """
+    Get the settings schema of an action, built once per action class.
+    
+    Args:
+        action: The action to get the schema for
+        
+    Returns:
+        dict: The action settings schema (shared, do not modify)
+    """
+    action_class = type(action)
+    schema = _schema_cache.get(action_class)
+    if schema is None:
+        schema = _schema_cache[action_class] = action.get_settings_schema()
+    return schema
 
 
 class CollapsibleGroupWidget(QFrame):
@@ -28,105 +255,53 @@ class CollapsibleGroupWidget(QFrame):
         self.is_main_category = is_main_category
         self.action_count = action_count
         self.is_expanded = False  # Start collapsed by default
-        self.content_widget = None
+        self.content_widgets = []  # Widgets shown below the header when expanded
         self.init_ui()
     
     def init_ui(self):
         """Initialize the collapsible group widget UI."""
         self.setFrameStyle(QFrame.StyledPanel)
         
-        # Different styling for main categories vs subcategories
-        if self.is_main_category:
-            self.setStyleSheet("""
-                QFrame { 
-                    border: 2px solid #4CAF50; 
-                    border-radius: 6px; 
-                    margin: 4px 0px; 
-                    padding: 4px; 
-                    background-color: #f1f8f4;
-                }
-                QFrame:hover {
-                    background-color: #e8f5e9;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame { 
-                    border: 1px solid #2196F3; 
-                    border-radius: 4px; 
-                    margin: 2px 0px; 
-                    padding: 4px; 
-                    background-color: #e3f2fd;
-                }
-                QFrame:hover {
-                    background-color: #bbdefb;
-                }
-            """)
-        
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(6, 6, 6, 6)
-        main_layout.setSpacing(4)
+        # Different styling for main categories vs subcategories (see _QSS)
+        self.setProperty("class", "mainCat" if self.is_main_category else "subCat")
         
-        # Header row with expand button and title
-        header_layout = QHBoxLayout()
-        header_layout.setSpacing(6)
+        # One grid for the whole group: the header in row 0, content widgets in the
+        # rows below, under the title column so they are indented past the button
+        self.grid_layout = QGridLayout(self)
+        self.grid_layout.setContentsMargins(6, 6, 6, 6)
+        self.grid_layout.setHorizontalSpacing(6)
+        self.grid_layout.setVerticalSpacing(4)
+        self.grid_layout.setColumnStretch(1, 1)
         
         # Expand/collapse button
         self.expand_btn = QPushButton("▶" if not self.is_expanded else "▼")
         self.expand_btn.setFixedSize(24, 24)
-        self.expand_btn.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background-color: transparent;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 0, 0, 0.1);
-                border-radius: 3px;
-            }
-        """)
+        self.expand_btn.setProperty("class", "expand")
         self.expand_btn.clicked.connect(self.toggle_expanded)
-        header_layout.addWidget(self.expand_btn)
+        self.grid_layout.addWidget(self.expand_btn, 0, 0)
         
         # Title label with count
         title_text = self.title
         if self.action_count > 0:
             title_text = f"{self.title} ({self.action_count})"
         title_label = QLabel(title_text)
-        title_font = QFont()
-        title_font.setBold(True)
-        if self.is_main_category:
-            title_font.setPointSize(12)
-        else:
-            title_font.setPointSize(11)
-        title_label.setFont(title_font)
-        header_layout.addWidget(title_label)
-        header_layout.addStretch()
-        
-        main_layout.addLayout(header_layout)
-        
-        # Content widget container
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout(self.content_widget)
-        self.content_layout.setContentsMargins(20, 4, 4, 4)  # Indent subcategories
-        self.content_layout.setSpacing(4)
-        main_layout.addWidget(self.content_widget)
-        
-        # Initially hide content (collapsed by default)
-        self.content_widget.setVisible(self.is_expanded)
+        title_label.setTextFormat(Qt.PlainText)
+        title_label.setFont(get_bold_font(12 if self.is_main_category else 11))
+        self.grid_layout.addWidget(title_label, 0, 1)
     
     def add_content_widget(self, widget):
         """Add a widget to the content area."""
-        self.content_layout.addWidget(widget)
+        self.grid_layout.addWidget(widget, self.grid_layout.rowCount(), 1)
+        widget.setVisible(self.is_expanded)
+        self.content_widgets.append(widget)
     
     def toggle_expanded(self):
         """Toggle the expanded/collapsed state."""
         self.is_expanded = not self.is_expanded
         
-        # Show/hide the content widget container
-        self.content_widget.setVisible(self.is_expanded)
+        # Show/hide the content widgets
+        for widget in self.content_widgets:
+            widget.setVisible(self.is_expanded)
         
         # Update button icon
         if self.is_expanded:
@@ -139,36 +314,26 @@ class CollapsibleActionWidget(QFrame):
     """
     A collapsible widget for displaying action settings.
     Shows only checkbox and name when collapsed, full details when expanded.
+    The details are built by content_factory the first time the widget is expanded.
     """
     
-    def __init__(self, action, checkbox, description_label, settings_button, parent=None):
+    def __init__(self, action, checkbox, content_factory, parent=None):
         super().__init__(parent)
         self.action = action
         self.checkbox = checkbox
-        self.description_label = description_label
-        self.settings_button = settings_button
+        self.content_factory = content_factory
         self.is_expanded = False
+        self.content_widget = None  # Created on first expansion
         self.init_ui()
     
     def init_ui(self):
         """Initialize the collapsible widget UI."""
         self.setFrameStyle(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame { 
-                border: 1px solid #ddd; 
-                border-radius: 4px; 
-                margin: 2px; 
-                padding: 4px; 
-                background-color: #fafafa;
-            }
-            QFrame:hover {
-                background-color: #f5f5f5;
-            }
-        """)
+        self.setProperty("class", "action")
         
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(6, 6, 6, 6)
-        main_layout.setSpacing(4)
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setContentsMargins(6, 6, 6, 6)
+        self.main_layout.setSpacing(4)
         
         # Header row with expand button, checkbox, and name
         header_layout = QHBoxLayout()
@@ -177,18 +342,7 @@ class CollapsibleActionWidget(QFrame):
         # Expand/collapse button
         self.expand_btn = QPushButton("▶")
         self.expand_btn.setFixedSize(20, 20)
-        self.expand_btn.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background-color: transparent;
-                font-size: 10px;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-                border-radius: 2px;
-            }
-        """)
+        self.expand_btn.setProperty("class", "expandAction")
         self.expand_btn.clicked.connect(self.toggle_expanded)
         header_layout.addWidget(self.expand_btn)
         
@@ -196,28 +350,29 @@ class CollapsibleActionWidget(QFrame):
         header_layout.addWidget(self.checkbox)
         header_layout.addStretch()
         
-        main_layout.addLayout(header_layout)
+        self.main_layout.addLayout(header_layout)
         
-        # Content widget (description and settings) - initially hidden
+        # Collapsed rows are only the header; the content widget is added when first expanded
+    
+    def _build_content(self):
+        """Build the content widget (description and settings) on first expansion."""
         self.content_widget = QWidget()
         content_layout = QVBoxLayout(self.content_widget)
         content_layout.setContentsMargins(26, 0, 0, 0)  # Indent to align with checkbox text
         content_layout.setSpacing(4)
         
-        if self.description_label:
-            content_layout.addWidget(self.description_label)
-        
-        if self.settings_button:
-            content_layout.addWidget(self.settings_button)
+        for widget in self.content_factory():
+            if widget:
+                content_layout.addWidget(widget)
+        self.content_factory = None
         
-        main_layout.addWidget(self.content_widget)
-        
-        # Initially collapsed
-        self.content_widget.setVisible(False)
+        self.main_layout.addWidget(self.content_widget)
     
     def toggle_expanded(self):
         """Toggle the expanded/collapsed state."""
         self.is_expanded = not self.is_expanded
+        if self.is_expanded and self.content_widget is None:
+            self._build_content()
         self.content_widget.setVisible(self.is_expanded)
         
         # Update button icon
@@ -234,10 +389,13 @@ class ActionSettingsWidget(QWidget):
     
     setting_changed = pyqtSignal(str, str, object)  # action_id, setting_name, value
     
-    def __init__(self, action, parent=None):
+    def __init__(self, action, parent=None, show_header=True):
         super().__init__(parent)
         self.action = action
+        self.show_header = show_header  # False when the parent window already shows title, description and reset
         self.setting_widgets = {}
+        self._schema = get_cached_settings_schema(action)
+        self._resetting = False  # True while widgets are refreshed with already saved values
         self.init_ui()
     
     def init_ui(self):
@@ -245,26 +403,27 @@ class ActionSettingsWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         
-        # Action title
-        title_label = QLabel(f"Settings for: {self.action.name}")
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(12)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
-        
-        # Action description
-        if self.action.description:
-            desc_label = QLabel(self.action.description)
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: #666; margin-bottom: 10px;")
-            layout.addWidget(desc_label)
+        if self.show_header:
+            # Action title
+            title_label = QLabel(f"Settings for: {self.action.name}")
+            title_label.setTextFormat(Qt.PlainText)
+            title_label.setFont(get_bold_font(12))
+            layout.addWidget(title_label)
+            
+            # Action description
+            description = (self.action.description or '').strip()
+            if description:
+                desc_label = QLabel(description)
+                desc_label.setTextFormat(Qt.PlainText)
+                desc_label.setWordWrap(True)
+                desc_label.setProperty("class", "tabDescription")
+                layout.addWidget(desc_label)
         
         # Settings schema
-        schema = self.action.get_settings_schema()
+        schema = self._schema
         if not schema:
             no_settings_label = QLabel("This action has no customizable settings.")
-            no_settings_label.setStyleSheet("color: #999; font-style: italic;")
+            no_settings_label.setProperty("class", "emptyNote")
             layout.addWidget(no_settings_label)
             return
         
@@ -273,30 +432,16 @@ class ActionSettingsWidget(QWidget):
             self.create_setting_widget(setting_name, setting_def, layout)
         
         # Add reset to defaults button
-        reset_layout = QHBoxLayout()
-        reset_layout.addStretch()
-        
-        reset_btn = QPushButton("Reset to Defaults")
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff9800;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #f57c00;
-            }
-            QPushButton:pressed {
-                background-color: #ef6c00;
-            }
-        """)
-        reset_btn.clicked.connect(self.reset_to_defaults)
-        reset_layout.addWidget(reset_btn)
-        
-        layout.addLayout(reset_layout)
+        if self.show_header:
+            reset_layout = QHBoxLayout()
+            reset_layout.addStretch()
+            
+            reset_btn = QPushButton("Reset to Defaults")
+            reset_btn.setProperty("class", "resetCompact")
+            reset_btn.clicked.connect(self.reset_to_defaults)
+            reset_layout.addWidget(reset_btn)
+            
+            layout.addLayout(reset_layout)
         
         # Add stretch
         layout.addStretch()
@@ -305,7 +450,7 @@ class ActionSettingsWidget(QWidget):
         """Create a widget for a specific setting."""
         setting_type = setting_def.get('type', 'str')
         label_text = setting_def.get('label', setting_name)
-        description = setting_def.get('description', '')
+        description = (setting_def.get('description') or '').strip()
         default_value = setting_def.get('default')
         
         # Get current value
@@ -313,21 +458,26 @@ class ActionSettingsWidget(QWidget):
         
         # Create label
         label = QLabel(label_text)
-        label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        label.setTextFormat(Qt.PlainText)
+        label.setProperty("class", "settingLabel")
         layout.addWidget(label)
         
         # Create description if available
         if description:
             desc_label = QLabel(description)
+            desc_label.setTextFormat(Qt.PlainText)
             desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: #666; font-size: 11px; margin-bottom: 5px;")
+            desc_label.setProperty("class", "settingDescription")
             layout.addWidget(desc_label)
         
+        # Slot receiving the new value from the widget's change signal
+        slot = partial(self.on_setting_changed, setting_name)
+        
         # Create appropriate widget based on type
         if setting_type == 'bool':
             widget = QCheckBox()
             widget.setChecked(bool(current_value))
-            widget.toggled.connect(lambda checked: self.on_setting_changed(setting_name, checked))
+            widget.toggled.connect(slot)
             
         elif setting_type in ['int', 'float']:
             if setting_type == 'int':
@@ -341,20 +491,21 @@ class ActionSettingsWidget(QWidget):
             
             step = setting_def.get('step', 1)
             widget.setSingleStep(step)
-            widget.valueChanged.connect(lambda value: self.on_setting_changed(setting_name, value))
+            widget.valueChanged.connect(slot)
             
         elif setting_type == 'choice':
             widget = QComboBox()
             options = setting_def.get('options', [])
             widget.addItems(options)
-            if current_value in options:
-                widget.setCurrentText(str(current_value))
-            widget.currentTextChanged.connect(lambda text: self.on_setting_changed(setting_name, text))
+            index = widget.findText(str(current_value))
+            if index >= 0:
+                widget.setCurrentIndex(index)
+            widget.currentTextChanged.connect(slot)
             
         elif setting_type == 'str':
             widget = QLineEdit()
             widget.setText(str(current_value))
-            widget.textChanged.connect(lambda text: self.on_setting_changed(setting_name, text))
+            widget.textChanged.connect(slot)
             
         elif setting_type == 'file_path':
             widget = QLineEdit()
@@ -396,22 +547,25 @@ class ActionSettingsWidget(QWidget):
             
         elif setting_type == 'color':
             widget = QPushButton()
-            color = QColor(str(current_value))
-            widget.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #ccc;")
-            widget.setText(color.name())
+            widget.setProperty("class", "colorSwatch")
+            self.set_color_button(widget, str(current_value))
             widget.clicked.connect(lambda: self.choose_color(setting_name, widget))
             
         else:
             # Fallback to text input
             widget = QLineEdit()
             widget.setText(str(current_value))
-            widget.textChanged.connect(lambda text: self.on_setting_changed(setting_name, text))
+            widget.textChanged.connect(slot)
         
         layout.addWidget(widget)
         self.setting_widgets[setting_name] = widget
     
     def on_setting_changed(self, setting_name, value):
         """Handle setting value change."""
+        # Widgets being refreshed show values the action has already saved
+        if self._resetting:
+            return
+        
         # Validate the setting
         is_valid, error_msg = self.action.validate_setting(setting_name, value)
         
@@ -445,13 +599,24 @@ class ActionSettingsWidget(QWidget):
     
     def choose_color(self, setting_name, button):
         """Choose a color."""
-        current_color = QColor(button.text())
+        current_color = QColor(button.property("hexColor"))
         color = QColorDialog.getColor(current_color, self, f"Choose color for {setting_name}")
         if color.isValid():
-            button.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #ccc;")
-            button.setText(color.name())
+            self.set_color_button(button, color.name())
             self.on_setting_changed(setting_name, color.name())
     
+    def set_color_button(self, button, color_name):
+        """
+        Show a color on a color swatch button.
+        
+        The color is kept as given in the "hexColor" property, and only parsed
+        when the color dialog is opened. Only the background is set on the button
+        itself; the rest of its style comes from the dialog stylesheet.
+        """
+        button.setProperty("hexColor", color_name)
+        button.setStyleSheet(f"background-color: {color_name};")
+        button.setText(color_name)
+    
     def reset_to_defaults(self):
         """Reset all settings for this action to their default values."""
         reply = QMessageBox.question(
@@ -467,11 +632,7 @@ class ActionSettingsWidget(QWidget):
             self.action.reset_settings_to_defaults()
             
             # Refresh all widgets with default values
-            schema = self.action.get_settings_schema()
-            for setting_name, setting_def in schema.items():
-                default_value = setting_def.get('default')
-                if default_value is not None:
-                    self.update_setting_widget(setting_name, default_value)
+            self.refresh_to_defaults()
             
             # Show confirmation
             QMessageBox.information(
@@ -480,6 +641,37 @@ class ActionSettingsWidget(QWidget):
                 f"All settings for '{self.action.name}' have been reset to their default values."
             )
     
+    def refresh_to_defaults(self):
+        """Show the default values in all setting widgets, after the action was reset."""
+        self._show_values({
+            setting_name: setting_def.get('default')
+            for setting_name, setting_def in self._schema.items()
+        })
+    
+    def refresh_from_saved(self):
+        """Show the saved values in all setting widgets, dropping unsaved or rejected edits."""
+        self._show_values({
+            setting_name: self.action.get_setting(setting_name, setting_def.get('default'))
+            for setting_name, setting_def in self._schema.items()
+        })
+    
+    def _show_values(self, values):
+        """
+        Show already saved values in the setting widgets as one batch.
+        
+        Args:
+            values (dict): Setting name -> value; None values are skipped
+        """
+        self._resetting = True
+        self.setUpdatesEnabled(False)
+        try:
+            for setting_name, value in values.items():
+                if value is not None:
+                    self.update_setting_widget(setting_name, value)
+        finally:
+            self.setUpdatesEnabled(True)
+            self._resetting = False
+    
     def update_setting_widget(self, setting_name, value):
         """Update a setting widget with a new value."""
         widget = self.setting_widgets.get(setting_name)
@@ -492,15 +684,14 @@ class ActionSettingsWidget(QWidget):
         elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
             widget.setValue(value)
         elif isinstance(widget, QComboBox):
-            if str(value) in [widget.itemText(i) for i in range(widget.count())]:
-                widget.setCurrentText(str(value))
+            index = widget.findText(str(value))
+            if index >= 0:
+                widget.setCurrentIndex(index)
         elif isinstance(widget, QLineEdit):
             widget.setText(str(value))
         elif isinstance(widget, QPushButton) and hasattr(widget, 'setStyleSheet'):
             # Color button
-            color = QColor(str(value))
-            widget.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #ccc;")
-            widget.setText(color.name())
+            self.set_color_button(widget, str(value))
 
 
 class ActionSettingsWindow(QDialog):
@@ -518,39 +709,34 @@ class ActionSettingsWindow(QDialog):
         self.setWindowTitle(f"Settings for: {self.action.name}")
         self.setModal(True)
         self.resize(500, 400)
+        # Opened from the settings dialog, the window inherits the stylesheet already
+        parent = self.parentWidget()
+        if parent is None or parent.window().styleSheet() != _QSS:
+            self.setStyleSheet(_QSS)
         
         # Main layout
         main_layout = QVBoxLayout(self)
         
         # Title
         title_label = QLabel(f"Configure Settings for: {self.action.name}")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setTextFormat(Qt.PlainText)
+        title_label.setFont(get_bold_font(14))
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
         
         # Action description
-        if self.action.description:
-            desc_label = QLabel(self.action.description)
+        description = (self.action.description or '').strip()
+        if description:
+            desc_label = QLabel(description)
+            desc_label.setTextFormat(Qt.PlainText)
             desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: #666; margin-bottom: 15px; padding: 10px; background-color: #f5f5f5; border-radius: 4px;")
+            desc_label.setProperty("class", "windowDescription")
             main_layout.addWidget(desc_label)
         
         # Warning label
         warning_label = QLabel("⚠️ These settings are for advanced users. Incorrect values may cause the action to malfunction.")
         warning_label.setWordWrap(True)
-        warning_label.setStyleSheet("""
-            color: #d84315;
-            font-weight: bold;
-            font-size: 12px;
-            background-color: #ffebee;
-            border: 1px solid #ffcdd2;
-            border-radius: 4px;
-            padding: 10px;
-            margin-bottom: 15px;
-        """)
+        warning_label.setProperty("class", "warning")
         main_layout.addWidget(warning_label)
         
         # Create scroll area for settings
@@ -558,11 +744,11 @@ class ActionSettingsWindow(QDialog):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
-        # Create settings widget
-        settings_widget = ActionSettingsWidget(self.action)
-        settings_widget.setting_changed.connect(self.on_setting_changed)
+        # Create settings widget; the window provides its own title, description and reset button
+        self.settings_widget = ActionSettingsWidget(self.action, show_header=False)
+        self.settings_widget.setting_changed.connect(self.on_setting_changed)
         
-        scroll_area.setWidget(settings_widget)
+        scroll_area.setWidget(self.settings_widget)
         main_layout.addWidget(scroll_area)
         
         # Button layout
@@ -570,22 +756,7 @@ class ActionSettingsWindow(QDialog):
         
         # Reset to defaults button
         reset_btn = QPushButton("Reset to Defaults")
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff9800;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #f57c00;
-            }
-            QPushButton:pressed {
-                background-color: #ef6c00;
-            }
-        """)
+        reset_btn.setProperty("class", "reset")
         reset_btn.clicked.connect(self.reset_to_defaults)
         button_layout.addWidget(reset_btn)
         
@@ -593,22 +764,7 @@ class ActionSettingsWindow(QDialog):
         
         # Close button
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196f3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976d2;
-            }
-            QPushButton:pressed {
-                background-color: #1565c0;
-            }
-        """)
+        close_btn.setProperty("class", "close")
         close_btn.clicked.connect(self.accept)
         button_layout.addWidget(close_btn)
         
@@ -633,9 +789,8 @@ class ActionSettingsWindow(QDialog):
             # Reset settings in the action
             self.action.reset_settings_to_defaults()
             
-            # Close and reopen the window to refresh
-            self.accept()
-            self.init_ui()
+            # Show the defaults in the open window
+            self.settings_widget.refresh_to_defaults()
             
             # Show confirmation
             QMessageBox.information(
@@ -665,23 +820,68 @@ class SettingsDialog(QDialog):
         self.click_type_to_tab_index = {}  # Map click_type to tab index
         self.tab_names = {}  # Store original tab names
         self.all_tab_index = None  # Index of the "All" tab
+        self._tab_builders = {}  # Tab index -> builder of a tab not built yet
+        self._action_windows = {}  # Action ID -> its settings window, reused when reopened
+        
+        # All action checkboxes report their toggles through one non-exclusive group
+        self._checkbox_group = QButtonGroup(self)
+        self._checkbox_group.setExclusive(False)
+        self._checkbox_group.buttonToggled.connect(self._on_action_toggled)
+        self._build_action_index()
         self.init_ui()
+    
+    def _build_action_index(self):
+        """
+        Index the registered actions by click type in a single pass.
+        
+        Universal actions are only listed under 'universal'; all other actions
+        are listed under each click type they support. The same pass counts the
+        total and enabled actions per click type; the counts are then kept up to
+        date by the checkbox handlers instead of being recounted.
+        """
+        self._all_actions = list(self.action_registry.get_all_actions())
+        self._universal_actions = []
+        self._actions_by_click_type = {}
+        self._click_types_by_action = {}  # Action ID -> click types it is counted under
+        self._actions_by_main_category = {}  # Main category -> actions, in registry order
+        self._enabled_state = {}  # Action ID -> saved enabled state, read once
+        self._counts = {}  # Click type -> [total, enabled]
+        self._all_counts = [len(self._all_actions), 0]  # [total, enabled] for the "All" tab
+        
+        for action in self._all_actions:
+            if 'universal' in action.supported_click_types:
+                self._universal_actions.append(action)
+                click_types = ['universal']
+            else:
+                click_types = list(dict.fromkeys(action.supported_click_types))
+                for click_type in click_types:
+                    self._actions_by_click_type.setdefault(click_type, []).append(action)
+            self._click_types_by_action[action.action_id] = click_types
+            
+            self._actions_by_main_category.setdefault(get_main_category(action), []).append(action)
+            
+            # Load saved setting or use current enabled state
+            enabled = self.settings.value(f"RightClickUtilities/{action.action_id}", action.enabled, type=bool)
+            self._enabled_state[action.action_id] = enabled
+            self._all_counts[1] += enabled
+            for click_type in click_types:
+                counts = self._counts.setdefault(click_type, [0, 0])
+                counts[0] += 1
+                counts[1] += enabled
         
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("Right-click Utilities - Settings")
         self.setModal(True)
         self.resize(600, 500)
+        self.setStyleSheet(_QSS)
         
         # Main layout
         main_layout = QVBoxLayout()
         
         # Title
         title_label = QLabel("Configure Right-click Actions")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(get_bold_font(14))
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
         
@@ -692,7 +892,7 @@ class SettingsDialog(QDialog):
             "💡 Tip: Click the '⚙️ Configure Settings (Advanced Users Only)' button under each action to customize its behavior in a separate window."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; margin-bottom: 10px;")
+        desc_label.setProperty("class", "tabDescription")
         main_layout.addWidget(desc_label)
         
         # Create tab widget
@@ -702,12 +902,10 @@ class SettingsDialog(QDialog):
         general_tab = self.create_general_tab()
         self.tab_widget.addTab(general_tab, "General")
         
-        # Add "All" tab after General
-        all_tab = self.create_all_actions_tab()
-        self.all_tab_index = 1  # Index 1 (after General at 0)
-        total, enabled = self.get_all_actions_counts()
-        tab_name_with_counts = f"All ({enabled}/{total})"
-        self.tab_widget.addTab(all_tab, tab_name_with_counts)
+        # Add "All" tab after General, built when it is first shown
+        self.all_tab_index = self.add_deferred_tab(self.create_all_actions_tab, "All")
+        self.update_all_actions_tab_name()
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         main_layout.addWidget(self.tab_widget)
         
@@ -751,6 +949,49 @@ class SettingsDialog(QDialog):
         
         self.setLayout(main_layout)
     
+    def add_deferred_tab(self, builder, tab_name):
+        """
+        Add a placeholder tab whose content is built the first time it is shown.
+        
+        Args:
+            builder (callable): Returns the tab content widget
+            tab_name (str): Display name for the tab
+            
+        Returns:
+            int: Index of the new tab
+        """
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        tab_index = self.tab_widget.addTab(placeholder, tab_name)
+        self._tab_builders[tab_index] = builder
+        return tab_index
+    
+    def _ensure_tab_built(self, tab_index):
+        """
+        Build the content of a deferred tab if it has not been built yet.
+        
+        The builders assemble the content without a parent; it is inserted into the
+        tab with updates suspended, so Qt lays it out and paints it once.
+        
+        Args:
+            tab_index (int): Index of the tab
+        """
+        builder = self._tab_builders.pop(tab_index, None)
+        if builder is None:
+            return
+        
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self.tab_widget.widget(tab_index).layout().addWidget(builder())
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+    
+    def _build_pending_tabs(self):
+        """Build all deferred tabs, so every action has its checkbox."""
+        for tab_index in list(self._tab_builders):
+            self._ensure_tab_built(tab_index)
+    
     def get_actions_for_click_type(self, click_type):
         """
         Get all actions that support a specific click type.
@@ -761,23 +1002,10 @@ class SettingsDialog(QDialog):
         Returns:
             list: List of actions that support this click type
         """
-        all_actions = self.action_registry.get_all_actions()
-        supported_actions = []
-        
-        for action in all_actions:
-            if click_type == 'universal':
-                # For universal tab, only show actions that support universal click type
-                if action.supports_click_type('universal') or 'universal' in action.supported_click_types:
-                    supported_actions.append(action)
-            else:
-                # For other tabs, show actions that support this specific click type
-                # but exclude universal actions (they should only appear in universal tab)
-                if (action.supports_click_type(click_type) and 
-                    not action.supports_click_type('universal') and 
-                    'universal' not in action.supported_click_types):
-                    supported_actions.append(action)
-        
-        return supported_actions
+        # Universal actions only appear in the universal tab
+        if click_type == 'universal':
+            return self._universal_actions
+        return self._actions_by_click_type.get(click_type, [])
     
     def get_action_counts(self, click_type):
         """
@@ -789,15 +1017,7 @@ class SettingsDialog(QDialog):
         Returns:
             tuple: (total_count, enabled_count)
         """
-        actions = self.get_actions_for_click_type(click_type)
-        total = len(actions)
-        enabled = 0
-        
-        for action in actions:
-            checkbox = self.checkboxes.get(action.action_id)
-            if checkbox and checkbox.isChecked():
-                enabled += 1
-        
+        total, enabled = self._counts.get(click_type, (0, 0))
         return total, enabled
     
     def update_tab_name(self, click_type):
@@ -816,13 +1036,19 @@ class SettingsDialog(QDialog):
         tab_name_with_counts = f"{original_name} ({enabled}/{total})"
         self.tab_widget.setTabText(tab_index, tab_name_with_counts)
     
+    def update_all_actions_tab_name(self):
+        """Update the "All" tab name with current counts."""
+        if self.all_tab_index is None:
+            return
+        
+        total, enabled = self.get_all_actions_counts()
+        tab_name_with_counts = f"All ({enabled}/{total})"
+        self.tab_widget.setTabText(self.all_tab_index, tab_name_with_counts)
+    
     def update_all_tab_names(self):
         """Update all tab names with current counts."""
         # Update "All" tab
-        if self.all_tab_index is not None:
-            total, enabled = self.get_all_actions_counts()
-            tab_name_with_counts = f"All ({enabled}/{total})"
-            self.tab_widget.setTabText(self.all_tab_index, tab_name_with_counts)
+        self.update_all_actions_tab_name()
         
         # Update click type tabs
         for click_type in self.click_type_to_tab_index.keys():
@@ -835,16 +1061,26 @@ class SettingsDialog(QDialog):
         Returns:
             tuple: (total_count, enabled_count)
         """
-        all_actions = self.action_registry.get_all_actions()
-        total = len(all_actions)
-        enabled = 0
+        total, enabled = self._all_counts
+        return total, enabled
+    
+    def _on_action_toggled(self, checkbox, checked):
+        """
+        Adjust the cached counts for a toggled action and update the affected tab names.
         
-        for action in all_actions:
-            checkbox = self.checkboxes.get(action.action_id)
-            if checkbox and checkbox.isChecked():
-                enabled += 1
+        Only the "All" tab and the tabs of the action's click types are renamed.
         
-        return total, enabled
+        Args:
+            checkbox (QCheckBox): The toggled action checkbox
+            checked (bool): The new checked state
+        """
+        action_id = checkbox.property("actionId")
+        delta = 1 if checked else -1
+        self._all_counts[1] += delta
+        self.update_all_actions_tab_name()
+        for click_type in self._click_types_by_action.get(action_id, ()):
+            self._counts[click_type][1] += delta
+            self.update_tab_name(click_type)
     
     def create_general_tab(self):
         """
@@ -863,7 +1099,7 @@ class SettingsDialog(QDialog):
             "These settings control the overall behavior of the plugin."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; margin-bottom: 10px;")
+        desc_label.setProperty("class", "tabDescription")
         layout.addWidget(desc_label)
         
         # Context Menu Settings group
@@ -891,7 +1127,7 @@ class SettingsDialog(QDialog):
             "you want to restore the original QGIS behavior."
         )
         explanation_label.setWordWrap(True)
-        explanation_label.setStyleSheet("color: #888; font-size: 11px; margin-top: 5px;")
+        explanation_label.setProperty("class", "explanation")
         settings_layout.addWidget(explanation_label)
         
         layout.addWidget(settings_group)
@@ -920,7 +1156,7 @@ class SettingsDialog(QDialog):
         desc_text = f"Actions available when right-clicking on {tab_name.lower()}:"
         desc_label = QLabel(desc_text)
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; margin-bottom: 10px;")
+        desc_label.setProperty("class", "tabDescription")
         layout.addWidget(desc_label)
         
         # Create scroll area for actions
@@ -938,7 +1174,7 @@ class SettingsDialog(QDialog):
         if not supported_actions:
             no_actions_label = QLabel(f"No actions available for {tab_name.lower()}.")
             no_actions_label.setAlignment(Qt.AlignCenter)
-            no_actions_label.setStyleSheet("color: #999; font-style: italic;")
+            no_actions_label.setProperty("class", "emptyNote")
             actions_layout.addWidget(no_actions_label)
         else:
             # Group actions by category
@@ -955,33 +1191,12 @@ class SettingsDialog(QDialog):
                 category_layout = QVBoxLayout(category_group)
                 
                 for action in actions:
-                    # Create checkbox for each action
-                    checkbox = QCheckBox(action.name)
-                    checkbox.setStyleSheet("QCheckBox { font-weight: bold; }")
-                    
-                    # Load saved setting or use current enabled state
-                    saved_enabled = self.settings.value(f"RightClickUtilities/{action.action_id}", action.enabled, type=bool)
-                    checkbox.setChecked(saved_enabled)
-                    
-                    # Store reference to checkbox
-                    self.checkboxes[action.action_id] = checkbox
-                    
-                    # Connect checkbox to update tab name when toggled
-                    checkbox.toggled.connect(lambda checked, ct=click_type: self.update_tab_name(ct))
-                    # Also update "All" tab when any checkbox is toggled
-                    checkbox.toggled.connect(lambda checked: self.update_all_tab_names())
-                    
-                    # Create description label
-                    description_label = QLabel(action.description or 'No description available')
-                    description_label.setWordWrap(True)
-                    description_label.setStyleSheet("color: #666; font-size: 11px;")
-                    
-                    # Create settings button
-                    settings_button = self.create_action_settings_button(action)
+                    # Checkbox for each action, shared with the other tabs
+                    checkbox = self.get_action_checkbox(action)
                     
-                    # Create collapsible action widget
+                    # Create collapsible action widget (details are built on first expand)
                     action_widget = CollapsibleActionWidget(
-                        action, checkbox, description_label, settings_button
+                        action, checkbox, partial(self.create_action_details, action)
                     )
                     
                     # Add action widget to category layout
@@ -1017,7 +1232,7 @@ class SettingsDialog(QDialog):
             "Click the arrows to expand/collapse sections. You can enable/disable actions and configure their settings from here."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666; margin-bottom: 10px;")
+        desc_label.setProperty("class", "tabDescription")
         layout.addWidget(desc_label)
         
         # Create scroll area for actions
@@ -1030,60 +1245,21 @@ class SettingsDialog(QDialog):
         actions_layout = QVBoxLayout(actions_widget)
         
         # Get all actions
-        all_actions = self.action_registry.get_all_actions()
+        all_actions = self._all_actions
         
         if not all_actions:
             no_actions_label = QLabel("No actions available.")
             no_actions_label.setAlignment(Qt.AlignCenter)
-            no_actions_label.setStyleSheet("color: #999; font-style: italic;")
+            no_actions_label.setProperty("class", "emptyNote")
             actions_layout.addWidget(no_actions_label)
         else:
-            # Map click types to display names
-            click_type_names = {
-                'point': 'Point RAT',
-                'multipoint': 'Point RAT',
-                'line': 'Line RAT',
-                'multiline': 'Line RAT',
-                'polygon': 'Polygon RAT',
-                'multipolygon': 'Polygon RAT',
-                'canvas': 'Canvas RAT',
-                'universal': 'Universal RAT'
-            }
-            
-            # Group actions by main category (click type) first
-            main_categories = {}
-            for action in all_actions:
-                # Determine main category based on supported click types
-                main_category = None
-                
-                # Check for universal first
-                if 'universal' in action.supported_click_types:
-                    main_category = 'Universal RAT'
-                # Check for canvas
-                elif 'canvas' in action.supported_click_types:
-                    main_category = 'Canvas RAT'
-                # Check for polygon types
-                elif any(ct in action.supported_click_types for ct in ['polygon', 'multipolygon']):
-                    main_category = 'Polygon RAT'
-                # Check for line types
-                elif any(ct in action.supported_click_types for ct in ['line', 'multiline']):
-                    main_category = 'Line RAT'
-                # Check for point types
-                elif any(ct in action.supported_click_types for ct in ['point', 'multipoint']):
-                    main_category = 'Point RAT'
-                else:
-                    # Default to Other if no clear category
-                    main_category = 'Other'
-                
-                if main_category not in main_categories:
-                    main_categories[main_category] = []
-                main_categories[main_category].append(action)
+            # Actions grouped by main category (click type), indexed when the dialog was created
+            main_categories = self._actions_by_main_category
             
             # Sort main categories in a specific order
-            category_order = ['Point RAT', 'Line RAT', 'Polygon RAT', 'Canvas RAT', 'Universal RAT', 'Other']
             sorted_main_categories = sorted(
                 main_categories.keys(),
-                key=lambda x: (category_order.index(x) if x in category_order else 999, x)
+                key=lambda x: (_CATEGORY_RANK.get(x, 999), x)
             )
             
             # Create main category groups
@@ -1125,37 +1301,12 @@ class SettingsDialog(QDialog):
                     
                     # Add actions to subcategory
                     for action in subcategory_actions:
-                        # Check if checkbox already exists (from other tabs)
-                        if action.action_id in self.checkboxes:
-                            # Use existing checkbox state but create new widget for this tab
-                            existing_checkbox = self.checkboxes[action.action_id]
-                            saved_enabled = existing_checkbox.isChecked()
-                        else:
-                            # Load saved setting or use current enabled state
-                            saved_enabled = self.settings.value(f"RightClickUtilities/{action.action_id}", action.enabled, type=bool)
-                        
-                        # Create checkbox for each action
-                        checkbox = QCheckBox(action.name)
-                        checkbox.setStyleSheet("QCheckBox { font-weight: bold; }")
-                        checkbox.setChecked(saved_enabled)
-                        
-                        # Store reference to checkbox (will overwrite if exists, but that's ok)
-                        self.checkboxes[action.action_id] = checkbox
+                        # Checkbox for each action, shared with the other tabs
+                        checkbox = self.get_action_checkbox(action)
                         
-                        # Connect checkbox to update tab names when toggled
-                        checkbox.toggled.connect(lambda checked: self.update_all_tab_names())
-                        
-                        # Create description label
-                        description_label = QLabel(action.description or 'No description available')
-                        description_label.setWordWrap(True)
-                        description_label.setStyleSheet("color: #666; font-size: 11px;")
-                        
-                        # Create settings button
-                        settings_button = self.create_action_settings_button(action)
-                        
-                        # Create collapsible action widget
+                        # Create collapsible action widget (details are built on first expand)
                         action_widget = CollapsibleActionWidget(
-                            action, checkbox, description_label, settings_button
+                            action, checkbox, partial(self.create_action_details, action)
                         )
                         
                         # Add action widget to subcategory group
@@ -1175,6 +1326,55 @@ class SettingsDialog(QDialog):
         
         return tab_widget
     
+    def get_action_checkbox(self, action):
+        """
+        Get the enabled checkbox of an action, creating it the first time.
+        
+        Each action has a single checkbox; a tab built later takes it over instead
+        of creating a second one that would have to be kept in sync.
+        
+        Args:
+            action: The action to get the checkbox for
+            
+        Returns:
+            QCheckBox: The action's checkbox
+        """
+        checkbox = self.checkboxes.get(action.action_id)
+        if checkbox is not None:
+            return checkbox
+        
+        checkbox = QCheckBox(action.name)
+        checkbox.setProperty("class", "actionToggle")
+        checkbox.setChecked(self._enabled_state[action.action_id])
+        
+        # The group updates the counts and tab names when the checkbox is toggled
+        checkbox.setProperty("actionId", action.action_id)
+        self._checkbox_group.addButton(checkbox)
+        
+        self.checkboxes[action.action_id] = checkbox
+        return checkbox
+    
+    def create_action_details(self, action):
+        """
+        Create the detail widgets shown when an action row is expanded.
+        
+        Args:
+            action: The action to create details for
+            
+        Returns:
+            list: The description label and the settings button (None if no settings)
+        """
+        # Create description label
+        description_label = QLabel((action.description or '').strip() or 'No description available')
+        description_label.setTextFormat(Qt.PlainText)
+        description_label.setWordWrap(True)
+        description_label.setProperty("class", "actionDescription")
+        
+        # Create settings button
+        settings_button = self.create_action_settings_button(action)
+        
+        return [description_label, settings_button]
+    
     def create_action_settings_button(self, action):
         """
         Create a settings button for an action that opens settings in a separate window.
@@ -1185,7 +1385,7 @@ class SettingsDialog(QDialog):
         Returns:
             QWidget: The settings button widget or None if no settings
         """
-        schema = action.get_settings_schema()
+        schema = get_cached_settings_schema(action)
         if not schema:
             return None
         
@@ -1195,23 +1395,7 @@ class SettingsDialog(QDialog):
         
         # Create settings button
         settings_btn = QPushButton("⚙️ Configure Settings (Advanced Users Only)")
-        settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff9800;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 3px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #f57c00;
-            }
-            QPushButton:pressed {
-                background-color: #ef6c00;
-            }
-        """)
+        settings_btn.setProperty("class", "settings")
         settings_btn.clicked.connect(lambda: self.open_action_settings_window(action))
         
         button_layout.addWidget(settings_btn)
@@ -1230,7 +1414,13 @@ class SettingsDialog(QDialog):
         Args:
             action: The action to configure settings for
         """
-        settings_window = ActionSettingsWindow(action, self)
+        # Closing the window only hides it, so it is built once per action and dialog
+        settings_window = self._action_windows.get(action.action_id)
+        if settings_window is None:
+            settings_window = self._action_windows[action.action_id] = ActionSettingsWindow(action, self)
+        else:
+            # A reused window may still show edits that failed validation
+            settings_window.settings_widget.refresh_from_saved()
         settings_window.exec_()
     
     def on_action_setting_changed(self, action_id, setting_name, value):
@@ -1248,15 +1438,41 @@ class SettingsDialog(QDialog):
     
     def select_all(self):
         """Select all actions."""
-        for checkbox in self.checkboxes.values():
-            checkbox.setChecked(True)
-        # Update all tab names after changes
-        self.update_all_tab_names()
+        self._set_all_checked(True)
     
     def deselect_all(self):
         """Deselect all actions."""
-        for checkbox in self.checkboxes.values():
-            checkbox.setChecked(False)
+        self._set_all_checked(False)
+    
+    def _set_all_checked(self, checked):
+        """
+        Check or uncheck every action checkbox as one batch.
+        
+        The checkbox group's signals are blocked and the tab widget is not repainted
+        while the checkboxes change; the tab names are updated once at the end.
+        Nothing is done when every action already has the requested state.
+        
+        Args:
+            checked (bool): The new checked state
+        """
+        total, enabled = self._all_counts
+        if enabled == (total if checked else 0):
+            return
+        
+        self._build_pending_tabs()
+        self.tab_widget.setUpdatesEnabled(False)
+        was_blocked = self._checkbox_group.blockSignals(True)
+        try:
+            for checkbox in self.checkboxes.values():
+                if checkbox.isChecked() != checked:
+                    checkbox.setChecked(checked)
+        finally:
+            self._checkbox_group.blockSignals(was_blocked)
+            self.tab_widget.setUpdatesEnabled(True)
+        # Every action now has the same state, so the enabled counts follow the totals
+        self._all_counts[1] = self._all_counts[0] if checked else 0
+        for counts in self._counts.values():
+            counts[1] = counts[0] if checked else 0
         # Update all tab names after changes
         self.update_all_tab_names()
     
@@ -1271,13 +1487,8 @@ class SettingsDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            for action in self.action_registry.get_all_actions():
-                checkbox = self.checkboxes.get(action.action_id)
-                if checkbox:
-                    # Reset to original default enabled state (True for all actions)
-                    checkbox.setChecked(True)
-            # Update all tab names after changes
-            self.update_all_tab_names()
+            # Reset to original default enabled state (True for all actions)
+            self._set_all_checked(True)
     
     def show_about(self):
         """Show information about the plugin."""
@@ -1302,6 +1513,7 @@ class SettingsDialog(QDialog):
         Returns:
             dict: Dictionary mapping action IDs to their enabled state
         """
+        self._build_pending_tabs()
         settings = {}
         for action_id, checkbox in self.checkboxes.items():
             settings[action_id] = checkbox.isChecked()
@@ -1309,10 +1521,13 @@ class SettingsDialog(QDialog):
     
     def apply_settings(self):
         """Apply the current settings to the action registry and save general settings."""
-        # Apply action settings
+        # Apply action settings, skipping actions whose state did not change
         for action_id, checkbox in self.checkboxes.items():
             enabled = checkbox.isChecked()
+            if enabled == self._enabled_state[action_id]:
+                continue
             self.action_registry.set_action_enabled(action_id, enabled)
+            self._enabled_state[action_id] = enabled
         
         # Apply general settings
         show_copy_coords = self.copy_coords_checkbox.isChecked()